@@ -0,0 +1,53 @@
+"""
+Request-path helpers for the web dashboard (app.py)
+
+Kept free of Flask imports and fully type-annotated so the module can be
+compiled with mypyc (``mypyc api_helpers.py``); the resulting extension is
+imported in place of this file when present.
+"""
+
+import base64
+import hashlib
+from collections import OrderedDict
+from itertools import islice
+from typing import Any, Dict, List, Optional
+
+from quantum_signatures import SignatureAlgorithm
+
+PQ_PREFIXES = ('Dilithium', 'Falcon', 'SPHINCS')
+
+# Algorithm lookup tables (the enum is static, so build these once at import)
+ALG_BY_VALUE: Dict[str, SignatureAlgorithm] = {alg.value: alg for alg in SignatureAlgorithm}
+ALGORITHM_LIST: List[Dict[str, str]] = [
+    {
+        'name': alg.name,
+        'value': alg.value,
+        'type': 'Post-Quantum' if alg.value.startswith(PQ_PREFIXES) else 'Classical'
+    }
+    for alg in ALG_BY_VALUE.values()
+]
+
+
+def recent_items(store: 'OrderedDict[str, Dict[str, Any]]', count: int = 5) -> List[Dict[str, Any]]:
+    """Return the newest entries of an ordered store, oldest first"""
+    return list(islice(reversed(store.values()), count))[::-1]
+
+
+def encode_record(record: Dict[str, Any]) -> Dict[str, Any]:
+    """Client view of a stored record: raw '*_bytes' fields become base64 strings"""
+    encoded: Dict[str, Any] = {}
+    for key, value in record.items():
+        if key.endswith('_bytes'):
+            encoded[key[:-6]] = base64.b64encode(value).decode()
+        else:
+            encoded[key] = value
+    return encoded
+
+
+def signed_payload(message_bytes: bytes, prehash: Optional[str]) -> bytes:
+    """Bytes actually passed to the signer for a stored signature"""
+    # Both forms carry a distinct tag, so a signature over a digest can never also
+    # verify a short message whose bytes happen to match it
+    if prehash:
+        return f"prehash-{prehash}:".encode() + hashlib.new(prehash, message_bytes).digest()
+    return b"message:" + message_bytes
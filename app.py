@@ -6,38 +6,114 @@ A Flask web application providing a modern GUI for quantum-safe cryptographic op
 import os
 import json
 import base64
+import itertools
 import secrets
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
-from flask import Flask, render_template, request, jsonify, session, flash, redirect, url_for
-from werkzeug.utils import secure_filename
+from functools import lru_cache
+from flask import Flask, Response, abort, render_template, request, jsonify
+from flask.json.provider import DefaultJSONProvider
+from werkzeug.exceptions import HTTPException, InternalServerError
 import logging
-from quantum_signatures import (
-    HybridSignatureSystem, 
-    SignatureAlgorithm, 
-    ClassicalSignature, 
-    QuantumSafeSignature
-)
+from quantum_signatures import HybridSignatureSystem, SignatureAlgorithm
+from api_helpers import ALG_BY_VALUE, ALGORITHM_LIST, encode_record, recent_items, signed_payload
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+class OrjsonProvider(DefaultJSONProvider):
+    """JSON provider that serializes API responses with orjson"""
+    
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, default=self.default, option=orjson.OPT_NON_STR_KEYS).decode()
+    
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
 # Initialize Flask app
 app = Flask(__name__)
-app.secret_key = secrets.token_hex(16)
+if ORJSON_AVAILABLE:
+    app.json = OrjsonProvider(app)
+app.secret_key = os.environ.get('FLASK_SECRET_KEY') or secrets.token_hex(16)
 app.config['MAX_CONTENT_LENGTH'] = 16 * 1024 * 1024  # 16MB max file size
 
 # Initialize the quantum-safe signature system
 sig_system = HybridSignatureSystem()
 
 # Global storage for demo purposes (in production, use a database)
+# Stores are bounded; the oldest entries are evicted first
+MAX_STORED_ITEMS = 10000
 app_data = {
-    'keypairs': {},
-    'signatures': {},
-    'certificates': {},
-    'benchmark_results': None
+    'keypairs': OrderedDict(),
+    'signatures': OrderedDict(),
+    'certificates': OrderedDict(),
+    'benchmark_results': None,
+    'jobs': OrderedDict()
 }
 
+# Messages longer than this are signed as a SHA-512 digest (hash-then-sign)
+PREHASH_THRESHOLD = 4096
+PREHASH_ALGORITHM = 'sha512'
+
+# Upper bound on certificates issued by a single create-certificate request
+MAX_CERTIFICATE_BATCH = 100
+
+# Parsed private keys by keypair id, so repeated signing skips key decoding
+_keypair_cache = OrderedDict()
+
+_store_lock = threading.Lock()
+
+# Record ids only index in-memory stores, so a random per-process prefix plus
+# a counter is enough and avoids an OS RNG call per request
+_id_prefix = secrets.token_hex(4)
+_id_counter = itertools.count()
+
+def _new_id():
+    """Return a new 16-character record id"""
+    return f'{_id_prefix}{next(_id_counter):08x}'
+
+def _put(store, key, value):
+    """Insert into a bounded store, evicting the oldest entry when full"""
+    with _store_lock:
+        store[key] = value
+        store.move_to_end(key)
+        if len(store) > MAX_STORED_ITEMS:
+            store.popitem(last=False)
+
+# Worker pool for long-running crypto jobs, so they don't block request threads
+executor = ProcessPoolExecutor(max_workers=os.cpu_count())
+
+_ALGORITHMS_JSON = json.dumps(ALGORITHM_LIST)
+
+# Dashboard stats are cached briefly and rebuilt whenever a store changes size
+_STATS_TTL = 5
+_stats_cache = {'key': None, 'expires': 0.0, 'stats': None}
+
+@app.errorhandler(HTTPException)
+def handle_http_error(e):
+    """Return API errors as JSON; pages keep Flask's default error response"""
+    if request.path.startswith('/api/'):
+        return jsonify({'error': e.description}), e.code
+    return e
+
+@app.errorhandler(Exception)
+def handle_unexpected_error(e):
+    """Log unexpected errors; API routes get them as JSON, pages keep Flask's error page"""
+    logger.error(f"Error handling {request.method} {request.path}: {e}")
+    if request.path.startswith('/api/'):
+        return jsonify({'error': str(e)}), 500
+    return InternalServerError(original_exception=e)
+
 @app.route('/')
 def dashboard():
     """Main dashboard page"""
@@ -48,242 +124,265 @@ def dashboard():
 @app.route('/api/algorithms')
 def get_algorithms():
     """Get list of supported algorithms"""
-    algorithms = []
-    for alg in SignatureAlgorithm:
-        algorithms.append({
-            'name': alg.name,
-            'value': alg.value,
-            'type': 'Post-Quantum' if alg.value.startswith(('Dilithium', 'Falcon', 'SPHINCS')) else 'Classical'
-        })
-    return jsonify(algorithms)
+    return Response(_ALGORITHMS_JSON, mimetype='application/json')
 
 @app.route('/api/generate-keypair', methods=['POST'])
 def generate_keypair():
     """Generate a new key pair for specified algorithm"""
-    try:
-        data = request.get_json()
-        algorithm_name = data.get('algorithm')
-        
-        # Find the algorithm enum
-        algorithm = None
-        for alg in SignatureAlgorithm:
-            if alg.value == algorithm_name:
-                algorithm = alg
-                break
-        
-        if not algorithm:
-            return jsonify({'error': 'Invalid algorithm'}), 400
-        
-        # Generate keypair
-        keypair = sig_system.create_keypair(algorithm)
-        
-        # Store keypair (encode bytes as base64 for JSON)
-        keypair_id = secrets.token_hex(8)
-        app_data['keypairs'][keypair_id] = {
-            'id': keypair_id,
-            'algorithm': algorithm.value,
-            'public_key': base64.b64encode(keypair.public_key).decode(),
-            'private_key': base64.b64encode(keypair.private_key).decode(),
-            'public_key_size': keypair.key_size_public,
-            'private_key_size': keypair.key_size_private,
-            'created_at': datetime.now().isoformat()
-        }
-        
-        return jsonify({
-            'success': True,
-            'keypair_id': keypair_id,
-            'algorithm': algorithm.value,
-            'public_key_size': keypair.key_size_public,
-            'private_key_size': keypair.key_size_private,
-            'public_key_preview': base64.b64encode(keypair.public_key)[:32].decode() + '...'
-        })
-        
-    except Exception as e:
-        logger.error(f"Error generating keypair: {e}")
-        return jsonify({'error': str(e)}), 500
+    data = request.get_json()
+    algorithm_name = data.get('algorithm')
+    
+    # Find the algorithm enum
+    algorithm = ALG_BY_VALUE.get(algorithm_name)
+    
+    if not algorithm:
+        abort(400, 'Invalid algorithm')
+    
+    # Generate keypair
+    keypair = sig_system.create_keypair(algorithm)
+    
+    # Store keypair (raw bytes; base64 only at the response boundary)
+    keypair_id = _new_id()
+    _put(app_data['keypairs'], keypair_id, {
+        'id': keypair_id,
+        'algorithm': algorithm.value,
+        'public_key_bytes': keypair.public_key,
+        'private_key_bytes': keypair.private_key,
+        'public_key_size': keypair.key_size_public,
+        'private_key_size': keypair.key_size_private,
+        'created_at': datetime.now().isoformat()
+    })
+    
+    return jsonify({
+        'success': True,
+        'keypair_id': keypair_id,
+        'algorithm': algorithm.value,
+        'public_key_size': keypair.key_size_public,
+        'private_key_size': keypair.key_size_private,
+        'public_key_preview': base64.b64encode(keypair.public_key[:24]).decode() + '...'
+    })
 
 @app.route('/api/sign-message', methods=['POST'])
 def sign_message():
     """Sign a message using specified keypair"""
-    try:
-        data = request.get_json()
-        keypair_id = data.get('keypair_id')
-        message = data.get('message', '').encode()
-        
-        if keypair_id not in app_data['keypairs']:
-            return jsonify({'error': 'Keypair not found'}), 404
-        
-        keypair_data = app_data['keypairs'][keypair_id]
-        algorithm = None
-        for alg in SignatureAlgorithm:
-            if alg.value == keypair_data['algorithm']:
-                algorithm = alg
-                break
-        
-        # Decode private key
-        private_key = base64.b64decode(keypair_data['private_key'])
-        
-        # Sign message
-        signature_obj = sig_system.sign_message(message, private_key, algorithm)
-        
-        # Store signature
-        signature_id = secrets.token_hex(8)
-        app_data['signatures'][signature_id] = {
-            'id': signature_id,
-            'keypair_id': keypair_id,
-            'algorithm': algorithm.value,
-            'message': message.decode(),
-            'signature': base64.b64encode(signature_obj.signature).decode(),
-            'signature_size': signature_obj.signature_size,
-            'timestamp': signature_obj.timestamp.isoformat()
-        }
-        
-        return jsonify({
-            'success': True,
-            'signature_id': signature_id,
-            'signature_size': signature_obj.signature_size,
-            'algorithm': algorithm.value,
-            'signature_preview': base64.b64encode(signature_obj.signature)[:32].decode() + '...'
-        })
-        
-    except Exception as e:
-        logger.error(f"Error signing message: {e}")
-        return jsonify({'error': str(e)}), 500
+    data = request.get_json(cache=False)
+    keypair_id = data.get('keypair_id')
+    message = data.get('message', '') or ''
+    
+    if keypair_id not in app_data['keypairs']:
+        abort(404, 'Keypair not found')
+    
+    keypair_data = app_data['keypairs'][keypair_id]
+    algorithm = ALG_BY_VALUE.get(keypair_data['algorithm'])
+    
+    # Parse the private key once per keypair
+    unpacked = _keypair_cache.get(keypair_id)
+    if unpacked is None:
+        unpacked = sig_system.unpack_private_key(keypair_data['private_key_bytes'], algorithm)
+        _put(_keypair_cache, keypair_id, unpacked)
+    
+    # Sign message (large messages are pre-hashed in C via hashlib)
+    message_bytes = message.encode()
+    prehash = PREHASH_ALGORITHM if len(message_bytes) > PREHASH_THRESHOLD else None
+    signature_obj = sig_system.sign_with_unpacked(signed_payload(message_bytes, prehash), unpacked)
+    
+    # Store signature
+    signature_id = _new_id()
+    _put(app_data['signatures'], signature_id, {
+        'id': signature_id,
+        'keypair_id': keypair_id,
+        'algorithm': algorithm.value,
+        'message': message,
+        'signature_bytes': signature_obj.signature,
+        'prehash': prehash,
+        'signature_size': signature_obj.signature_size,
+        'timestamp': signature_obj.timestamp.isoformat()
+    })
+    
+    return jsonify({
+        'success': True,
+        'signature_id': signature_id,
+        'signature_size': signature_obj.signature_size,
+        'algorithm': algorithm.value,
+        'signature_preview': base64.b64encode(signature_obj.signature[:24]).decode() + '...'
+    })
+
+@lru_cache(maxsize=1024)
+def _cached_verify(message, prehash, signature_bytes, public_key_bytes, algorithm_value):
+    """Verify a signature, cached on everything the result depends on
+    
+    Keying on the record contents rather than its id means an evicted and
+    re-used id can never return a stale result.
+    """
+    return sig_system.verify_signature(
+        signed_payload(message.encode(), prehash),
+        signature_bytes,
+        public_key_bytes,
+        ALG_BY_VALUE.get(algorithm_value)
+    )
 
 @app.route('/api/verify-signature', methods=['POST'])
 def verify_signature():
     """Verify a signature"""
-    try:
-        data = request.get_json()
-        signature_id = data.get('signature_id')
-        
-        if signature_id not in app_data['signatures']:
-            return jsonify({'error': 'Signature not found'}), 404
-        
-        signature_data = app_data['signatures'][signature_id]
-        keypair_data = app_data['keypairs'][signature_data['keypair_id']]
-        
-        algorithm = None
-        for alg in SignatureAlgorithm:
-            if alg.value == signature_data['algorithm']:
-                algorithm = alg
-                break
-        
-        # Decode data
-        message = signature_data['message'].encode()
-        signature = base64.b64decode(signature_data['signature'])
-        public_key = base64.b64decode(keypair_data['public_key'])
-        
-        # Verify signature
-        is_valid = sig_system.verify_signature(message, signature, public_key, algorithm)
-        
-        return jsonify({
-            'success': True,
-            'valid': is_valid,
-            'algorithm': algorithm.value,
-            'message': signature_data['message']
-        })
-        
-    except Exception as e:
-        logger.error(f"Error verifying signature: {e}")
-        return jsonify({'error': str(e)}), 500
+    data = request.get_json()
+    signature_id = data.get('signature_id')
+    
+    # Look both records up together so _put can't evict one in between
+    with _store_lock:
+        signature_data = app_data['signatures'].get(signature_id)
+        keypair_data = (app_data['keypairs'].get(signature_data['keypair_id'])
+                        if signature_data is not None else None)
+    
+    if signature_data is None:
+        abort(404, 'Signature not found')
+    if keypair_data is None:
+        abort(404, 'Keypair not found')
+    
+    # Verify signature
+    is_valid = _cached_verify(signature_data['message'], signature_data['prehash'],
+                              signature_data['signature_bytes'], keypair_data['public_key_bytes'],
+                              signature_data['algorithm'])
+    
+    return jsonify({
+        'success': True,
+        'valid': is_valid,
+        'algorithm': signature_data['algorithm'],
+        'message': signature_data['message']
+    })
+
+def _benchmark_job(message_size, iterations):
+    """Benchmark entry point executed inside a worker process"""
+    return sig_system.benchmark_algorithms(message_size=message_size, iterations=iterations)
+
+def _store_benchmark_results(future):
+    """Keep the latest successful benchmark for the benchmark page"""
+    if not future.cancelled() and future.exception() is None:
+        app_data['benchmark_results'] = future.result()
 
 @app.route('/api/benchmark', methods=['POST'])
 def run_benchmark():
-    """Run performance benchmark"""
-    try:
-        data = request.get_json()
-        message_size = data.get('message_size', 1024)
-        iterations = data.get('iterations', 10)
-        
-        # Run benchmark
-        results = sig_system.benchmark_algorithms(message_size=message_size, iterations=iterations)
-        app_data['benchmark_results'] = results
-        
-        return jsonify({
-            'success': True,
-            'results': results
-        })
-        
-    except Exception as e:
-        logger.error(f"Error running benchmark: {e}")
-        return jsonify({'error': str(e)}), 500
+    """Start a performance benchmark job"""
+    data = request.get_json()
+    message_size = data.get('message_size', 1024)
+    iterations = data.get('iterations', 10)
+    
+    # Run benchmark in the worker pool; the client polls /api/job/<job_id>
+    future = executor.submit(_benchmark_job, message_size, iterations)
+    future.add_done_callback(_store_benchmark_results)
+    
+    job_id = _new_id()
+    _put(app_data['jobs'], job_id, future)
+    
+    return jsonify({
+        'success': True,
+        'job_id': job_id
+    }), 202
+
+@app.route('/api/job/<job_id>')
+def get_job(job_id):
+    """Get the status of a background job"""
+    future = app_data['jobs'].get(job_id)
+    if future is None:
+        abort(404, 'Job not found')
+    
+    if not future.done():
+        return jsonify({'success': True, 'done': False, 'result': None})
+    
+    # Finished jobs are handed out once and then forgotten
+    with _store_lock:
+        app_data['jobs'].pop(job_id, None)
+    return jsonify({'success': True, 'done': True, 'result': future.result()})
 
 @app.route('/api/create-certificate', methods=['POST'])
 def create_certificate():
     """Create a quantum-safe certificate"""
-    try:
-        data = request.get_json()
-        subject_name = data.get('subject_name')
-        algorithm_name = data.get('algorithm')
-        validity_days = data.get('validity_days', 365)
-        
-        algorithm = None
-        for alg in SignatureAlgorithm:
-            if alg.value == algorithm_name:
-                algorithm = alg
-                break
-        
-        if not algorithm:
-            return jsonify({'error': 'Invalid algorithm'}), 400
-        
-        # Create certificate chain
-        chain = sig_system.create_certificate_chain(subject_name, algorithm, validity_days)
-        
-        # Store certificate
-        cert_id = secrets.token_hex(8)
-        app_data['certificates'][cert_id] = {
+    data = request.get_json()
+    subject_name = data.get('subject_name')
+    algorithm_name = data.get('algorithm')
+    validity_days = data.get('validity_days', 365)
+    count = data.get('count', 1)
+    
+    algorithm = ALG_BY_VALUE.get(algorithm_name)
+    
+    if not algorithm:
+        abort(400, 'Invalid algorithm')
+    
+    if not isinstance(count, int) or not 1 <= count <= MAX_CERTIFICATE_BATCH:
+        abort(400, f'count must be between 1 and {MAX_CERTIFICATE_BATCH}')
+    
+    # Create certificate chains (subject keys for bulk requests use the worker pool)
+    if count == 1:
+        chains = [sig_system.create_certificate_chain(subject_name, algorithm, validity_days)]
+    else:
+        chains = sig_system.create_certificate_chain_batch(
+            subject_name, algorithm, count, validity_days, executor=executor
+        )
+    
+    # Store certificates
+    created_at = datetime.now().isoformat()
+    cert_ids = []
+    for chain in chains:
+        certificate = chain['subject_certificate']
+        valid_to = certificate.valid_to.isoformat()
+        cert_id = _new_id()
+        _put(app_data['certificates'], cert_id, {
             'id': cert_id,
             'subject_name': subject_name,
             'algorithm': algorithm.value,
-            'valid_from': chain['subject_certificate'].valid_from.isoformat(),
-            'valid_to': chain['subject_certificate'].valid_to.isoformat(),
-            'serial_number': chain['subject_certificate'].serial_number,
+            'valid_from': certificate.valid_from.isoformat(),
+            'valid_to': valid_to,
+            'serial_number': certificate.serial_number,
             'chain_valid': chain['chain_valid'],
             'public_key_size': chain['subject_keypair'].key_size_public,
-            'created_at': datetime.now().isoformat()
-        }
-        
-        return jsonify({
-            'success': True,
-            'certificate_id': cert_id,
-            'subject_name': subject_name,
-            'algorithm': algorithm.value,
-            'valid_until': chain['subject_certificate'].valid_to.isoformat(),
-            'chain_valid': chain['chain_valid']
+            'created_at': created_at
         })
-        
-    except Exception as e:
-        logger.error(f"Error creating certificate: {e}")
-        return jsonify({'error': str(e)}), 500
+        cert_ids.append(cert_id)
+    
+    response = {
+        'success': True,
+        'certificate_id': cert_ids[0],
+        'subject_name': subject_name,
+        'algorithm': algorithm.value,
+        'valid_until': valid_to,
+        'chain_valid': all(chain['chain_valid'] for chain in chains)
+    }
+    if count > 1:
+        response['certificate_ids'] = cert_ids
+    
+    return jsonify(response)
 
 @app.route('/api/dashboard-stats')
 def get_dashboard_stats():
     """Get dashboard statistics"""
-    stats = {
-        'total_keypairs': len(app_data['keypairs']),
-        'total_signatures': len(app_data['signatures']),
-        'total_certificates': len(app_data['certificates']),
-        'supported_algorithms': len(list(SignatureAlgorithm)),
-        'recent_keypairs': list(app_data['keypairs'].values())[-5:],
-        'recent_signatures': list(app_data['signatures'].values())[-5:],
-        'recent_certificates': list(app_data['certificates'].values())[-5:],
-    }
-    return jsonify(stats)
+    key = (len(app_data['keypairs']), len(app_data['signatures']), len(app_data['certificates']))
+    now = time.monotonic()
+    if _stats_cache['key'] != key or now >= _stats_cache['expires']:
+        _stats_cache['key'] = key
+        _stats_cache['expires'] = now + _STATS_TTL
+        _stats_cache['stats'] = {
+            'total_keypairs': key[0],
+            'total_signatures': key[1],
+            'total_certificates': key[2],
+            'supported_algorithms': len(ALG_BY_VALUE),
+            'recent_keypairs': [encode_record(kp) for kp in recent_items(app_data['keypairs'])],
+            'recent_signatures': [encode_record(sig) for sig in recent_items(app_data['signatures'])],
+            'recent_certificates': recent_items(app_data['certificates']),
+        }
+    return jsonify(_stats_cache['stats'])
 
 @app.route('/keypairs')
 def keypairs():
     """Key pairs management page"""
     return render_template('keypairs.html', 
-                         keypairs=app_data['keypairs'].values(),
+                         keypairs=[encode_record(kp) for kp in app_data['keypairs'].values()],
                          algorithms=SignatureAlgorithm)
 
 @app.route('/signatures')
 def signatures():
     """Signatures management page"""
     return render_template('signatures.html', 
-                         signatures=app_data['signatures'].values(),
-                         keypairs=app_data['keypairs'])
+                         signatures=[encode_record(sig) for sig in app_data['signatures'].values()],
+                         keypairs={kp_id: encode_record(kp) for kp_id, kp in app_data['keypairs'].items()})
 
 @app.route('/certificates')
 def certificates():
@@ -307,15 +406,11 @@ def crypto_agility():
 @app.route('/api/crypto-agility-demo', methods=['POST'])
 def crypto_agility_demo():
     """Run crypto-agility demonstration"""
-    try:
-        results = sig_system.crypto_agility_demo()
-        return jsonify({
-            'success': True,
-            'results': results
-        })
-    except Exception as e:
-        logger.error(f"Error running crypto-agility demo: {e}")
-        return jsonify({'error': str(e)}), 500
+    results = sig_system.crypto_agility_demo()
+    return jsonify({
+        'success': True,
+        'results': results
+    })
 
 if __name__ == '__main__':
     # Create templates directory if it doesn't exist
@@ -323,6 +418,7 @@ if __name__ == '__main__':
     os.makedirs('static/css', exist_ok=True)
     os.makedirs('static/js', exist_ok=True)
     
+    # Development server only; for deployment use: gunicorn -c gunicorn_conf.py app:app
     print("Starting Quantum-Safe Cryptography Dashboard...")
     print("Access the dashboard at: http://localhost:5000")
-    app.run(debug=True, host='0.0.0.0', port=5000)
+    app.run(debug=bool(os.environ.get('FLASK_DEV')), host='0.0.0.0', port=5000, threaded=True)
@@ -4,34 +4,124 @@ Demonstrates TLS client-server communication with hybrid cryptography and crypto
 """
 
 import asyncio
+import os
+import sys
 import socket
 import ssl
+import struct
 import json
 import time
 import threading
 import logging
 import base64
-from typing import Dict, List, Optional, Tuple, Any, Callable
+from typing import Dict, List, Optional, Tuple, Any, Callable, Union
 from enum import Enum
 from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
 import secrets
 from datetime import datetime
 
 from hybrid_tls import HybridTLSHandshake, KeyExchangeType, CryptoAlgorithm
 from quantum_signatures import HybridSignatureSystem, SignatureAlgorithm
 
-def make_json_serializable(obj):
-    """Convert objects containing bytes to JSON-serializable format"""
-    if isinstance(obj, dict):
-        return {k: make_json_serializable(v) for k, v in obj.items()}
-    elif isinstance(obj, list):
-        return [make_json_serializable(item) for item in obj]
-    elif isinstance(obj, bytes):
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import uvloop
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
+
+def _json_default(obj):
+    """Encode bytes as base64 and datetimes as ISO strings during serialization"""
+    if isinstance(obj, (bytes, bytearray)):
         return base64.b64encode(obj).decode('utf-8')
-    elif isinstance(obj, datetime):
+    if isinstance(obj, datetime):
         return obj.isoformat()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+def encode_message(obj: Any) -> bytes:
+    """Serialize a wire message to UTF-8 JSON bytes"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, default=_json_default, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, default=_json_default).encode('utf-8')
+
+def decode_message(data) -> Any:
+    """Parse a wire message from UTF-8 JSON bytes"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    if isinstance(data, memoryview):
+        data = data.tobytes()
+    return json.loads(data)
+
+_logging_configured = False
+
+def _configure_logging():
+    """Apply the demo's logging format once per process"""
+    global _logging_configured
+    if not _logging_configured:
+        logging.basicConfig(level=logging.INFO,
+                          format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+        _logging_configured = True
+
+# Certificate chains are issued in the background so construction returns immediately
+_certificate_pool = ThreadPoolExecutor(max_workers=os.cpu_count(), thread_name_prefix="qs-cert")
+
+_HAS_SENDMSG = hasattr(socket.socket, "sendmsg")
+
+# Frames are prefixed with the payload length as a big-endian uint32
+_FRAME_HEADER = struct.Struct("!I")
+
+def send_frame(sock: socket.socket, payload: bytes) -> int:
+    """Send a 4-byte length-prefixed frame with a single socket call
+    
+    Returns the number of bytes written (header included).
+    """
+    frame_size = len(payload) + 4
+    if _HAS_SENDMSG:
+        # Gather write: header and payload leave in one syscall without a copy
+        header = _FRAME_HEADER.pack(len(payload))
+        sent = sock.sendmsg([header, payload])
+        if sent < frame_size:
+            sock.sendall(memoryview(header + payload)[sent:])
     else:
-        return obj
+        frame = bytearray(frame_size)
+        _FRAME_HEADER.pack_into(frame, 0, len(payload))
+        frame[4:] = payload
+        sock.sendall(frame)
+    return frame_size
+
+RECV_BUFFER_SIZE = 64 * 1024
+
+def recv_exact(sock: socket.socket, size: int,
+               buffer: Optional[bytearray] = None) -> Optional[memoryview]:
+    """Read exactly ``size`` bytes into a preallocated buffer
+    
+    When ``buffer`` is given and large enough it is reused, and the returned
+    view is only valid until the next read into it. Returns None if the peer
+    closes the connection before the frame is complete.
+    """
+    if buffer is None or len(buffer) < size:
+        buffer = bytearray(size)
+    view = memoryview(buffer)[:size]
+    offset = 0
+    while offset < size:
+        received = sock.recv_into(view[offset:], size - offset)
+        if not received:
+            return None
+        offset += received
+    return view
+
+def _enable_nodelay(sock: socket.socket):
+    """Disable Nagle; frames are already length-prefixed and sent whole"""
+    try:
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    except OSError:
+        pass
 
 class ConnectionMode(Enum):
     """Connection security modes"""
@@ -40,6 +130,14 @@ class ConnectionMode(Enum):
     PQ_ONLY = "post_quantum"
     AUTO_NEGOTIATE = "auto_negotiate"
 
+# Key exchange used for each mode; auto-negotiation defaults to hybrid
+_MODE_TO_EXCHANGE = {
+    ConnectionMode.CLASSICAL: KeyExchangeType.CLASSICAL,
+    ConnectionMode.HYBRID: KeyExchangeType.DUAL_HYBRID,
+    ConnectionMode.PQ_ONLY: KeyExchangeType.PQ_ONLY,
+    ConnectionMode.AUTO_NEGOTIATE: KeyExchangeType.DUAL_HYBRID
+}
+
 @dataclass
 class ServerConfig:
     """Server configuration"""
@@ -72,7 +170,7 @@ class ConnectionSession:
     client_address: Tuple[str, int]
     handshake_result: Dict[str, Any]
     established_time: datetime
-    last_activity: datetime
+    last_activity: float  # time.time() of the last received frame
     bytes_sent: int = 0
     bytes_received: int = 0
 
@@ -85,34 +183,60 @@ class QuantumSafeServer:
         self.signature_system = HybridSignatureSystem()
         self.running = False
         self.server_socket = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._async_stop: Optional[asyncio.Event] = None
+        self._pool: Optional[ThreadPoolExecutor] = None
+        self.ready = threading.Event()  # set once listening with the certificate issued
         
         # Setup logging
-        logging.basicConfig(level=logging.INFO, 
-                          format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+        _configure_logging()
         self.logger = logging.getLogger(f"QSServer-{config.port}")
         
         # Create server certificate
-        self.server_cert_chain = self.signature_system.create_certificate_chain(
-            f"QS-Server-{config.host}:{config.port}",
-            config.signature_alg
-        )
+        self._cert_future = _certificate_pool.submit(self._create_certificate)
+        
+        # Static part of every crypto_info response, encoded once
+        self._server_config_json = encode_message({
+            "mode": config.mode.value,
+            "classical_alg": config.classical_alg.value,
+            "pq_alg1": config.pq_alg1.value,
+            "pq_alg2": config.pq_alg2.value if config.pq_alg2 else None,
+            "signature_alg": config.signature_alg.value
+        })
         
         self.logger.info(f"Server initialized with {config.mode.value} mode")
     
+    def _create_certificate(self) -> Tuple[Dict[str, Any], Dict[str, str]]:
+        """Issue the server certificate chain and its handshake fragment"""
+        cert_chain = self.signature_system.create_certificate_chain(
+            f"QS-Server-{self.config.host}:{self.config.port}",
+            self.config.signature_alg
+        )
+        
+        # The certificate is immutable, so its handshake fragment is built once
+        subject_cert = cert_chain["subject_certificate"]
+        fragment = {
+            "subject": subject_cert.subject,
+            "algorithm": subject_cert.algorithm.value,
+            "valid_from": subject_cert.valid_from.isoformat(),
+            "valid_to": subject_cert.valid_to.isoformat()
+        }
+        return cert_chain, fragment
+    
+    @property
+    def server_cert_chain(self) -> Dict[str, Any]:
+        """Server certificate chain, waiting for it to be issued if necessary"""
+        return self._cert_future.result()[0]
+    
+    @property
+    def _cert_response_fragment(self) -> Dict[str, str]:
+        return self._cert_future.result()[1]
+    
     def _create_handshake_handler(self, client_socket: socket.socket, 
                                 client_address: Tuple[str, int]) -> HybridTLSHandshake:
         """Create appropriate handshake handler based on server mode"""
-        if self.config.mode == ConnectionMode.CLASSICAL:
-            exchange_type = KeyExchangeType.CLASSICAL
-        elif self.config.mode == ConnectionMode.HYBRID:
-            exchange_type = KeyExchangeType.DUAL_HYBRID
-        elif self.config.mode == ConnectionMode.PQ_ONLY:
-            exchange_type = KeyExchangeType.PQ_ONLY
-        else:  # AUTO_NEGOTIATE
-            exchange_type = KeyExchangeType.DUAL_HYBRID  # Default to hybrid
-        
         return HybridTLSHandshake(
-            exchange_type=exchange_type,
+            exchange_type=_MODE_TO_EXCHANGE[self.config.mode],
             classical_alg=self.config.classical_alg,
             pq_alg1=self.config.pq_alg1,
             pq_alg2=self.config.pq_alg2
@@ -126,48 +250,10 @@ class QuantumSafeServer:
         
         try:
             client_socket.settimeout(self.config.timeout)
+            _enable_nodelay(client_socket)
             
-            # Perform quantum-safe TLS handshake
-            handshake = self._create_handshake_handler(client_socket, client_address)
-            handshake_result = handshake.perform_handshake()
-            
-            # Create session
-            session = ConnectionSession(
-                session_id=session_id,
-                client_address=client_address,
-                handshake_result=handshake_result,
-                established_time=datetime.now(),
-                last_activity=datetime.now()
-            )
-            self.sessions[session_id] = session
-            
-            # Send handshake confirmation
-            handshake_response = {
-                "status": "handshake_complete",
-                "session_id": session_id,
-                "server_mode": self.config.mode.value,
-                "algorithms_used": handshake_result["algorithms"],
-                "exchange_type": handshake_result["exchange_type"],
-                "handshake_duration": handshake_result["handshake_duration"],
-                "server_certificate": {
-                    "subject": self.server_cert_chain["subject_certificate"].subject,
-                    "algorithm": self.server_cert_chain["subject_certificate"].algorithm.value,
-                    "valid_from": self.server_cert_chain["subject_certificate"].valid_from.isoformat(),
-                    "valid_to": self.server_cert_chain["subject_certificate"].valid_to.isoformat()
-                }
-            }
-            
-            # Make response JSON-serializable
-            handshake_response = make_json_serializable(handshake_response)
-            
-            response_data = json.dumps(handshake_response).encode('utf-8')
-            client_socket.send(len(response_data).to_bytes(4, byteorder='big'))
-            client_socket.send(response_data)
-            session.bytes_sent += len(response_data) + 4
-            
-            self.logger.info(f"Handshake completed for session {session_id}: "
-                           f"{handshake_result['exchange_type']} in "
-                           f"{handshake_result['handshake_duration']:.3f}s")
+            session, response_data = self._establish_session(session_id, client_address)
+            session.bytes_sent += send_frame(client_socket, response_data)
             
             # Handle application data exchange
             self._handle_application_data(client_socket, session)
@@ -185,45 +271,82 @@ class QuantumSafeServer:
             except:
                 pass
     
+    def _establish_session(self, session_id: str,
+                           client_address: Tuple[str, int]) -> Tuple[ConnectionSession, bytes]:
+        """Run the handshake, register the session and encode its confirmation"""
+        # Perform quantum-safe TLS handshake
+        handshake = self._create_handshake_handler(None, client_address)
+        handshake_result = handshake.perform_handshake()
+        
+        # Create session
+        session = ConnectionSession(
+            session_id=session_id,
+            client_address=client_address,
+            handshake_result=handshake_result,
+            established_time=datetime.now(),
+            last_activity=time.time()
+        )
+        self.sessions[session_id] = session
+        
+        # Handshake confirmation
+        handshake_response = {
+            "status": "handshake_complete",
+            "session_id": session_id,
+            "server_mode": self.config.mode.value,
+            "algorithms_used": handshake_result["algorithms"],
+            "exchange_type": handshake_result["exchange_type"],
+            "handshake_duration": handshake_result["handshake_duration"],
+            "server_certificate": self._cert_response_fragment
+        }
+        
+        self.logger.info(f"Handshake completed for session {session_id}: "
+                       f"{handshake_result['exchange_type']} in "
+                       f"{handshake_result['handshake_duration']:.3f}s")
+        
+        return session, encode_message(handshake_response)
+    
+    def _handle_frame(self, message_data: memoryview, session: ConnectionSession) -> bytes:
+        """Decode one request frame, process it and return the encoded response"""
+        session.bytes_received += len(message_data) + 4
+        session.last_activity = time.time()
+        
+        message = decode_message(message_data)
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("Received message type: %s", message.get('type', 'unknown'))
+        
+        # Process message based on type
+        response = self._process_message(message, session)
+        if isinstance(response, bytes):
+            return response
+        return encode_message(response)
+    
     def _handle_application_data(self, client_socket: socket.socket, 
                                session: ConnectionSession):
         """Handle application-level data exchange"""
+        # One receive buffer per connection, grown only for oversized frames
+        recv_buffer = bytearray(RECV_BUFFER_SIZE)
         while self.running:
             try:
                 # Receive message length
-                length_data = client_socket.recv(4)
-                if not length_data:
+                length_data = recv_exact(client_socket, 4)
+                if length_data is None:
                     break
                 
-                message_length = int.from_bytes(length_data, byteorder='big')
+                message_length, = _FRAME_HEADER.unpack(length_data)
                 if message_length > 1024 * 1024:  # 1MB limit
-                    self.logger.warning(f"Message too large: {message_length} bytes")
+                    self.logger.warning("Message too large: %d bytes", message_length)
                     break
                 
                 # Receive message data
-                message_data = b""
-                while len(message_data) < message_length:
-                    chunk = client_socket.recv(min(message_length - len(message_data), 4096))
-                    if not chunk:
-                        break
-                    message_data += chunk
-                
-                session.bytes_received += len(message_data) + 4
-                session.last_activity = datetime.now()
+                if message_length > len(recv_buffer):
+                    recv_buffer = bytearray(message_length)
+                message_data = recv_exact(client_socket, message_length, recv_buffer)
+                if message_data is None:
+                    break
                 
-                # Parse message
                 try:
-                    message = json.loads(message_data.decode('utf-8'))
-                    self.logger.debug(f"Received message type: {message.get('type', 'unknown')}")
-                    
-                    # Process message based on type
-                    response = self._process_message(message, session)
-                    
-                    # Send response
-                    response_data = json.dumps(response).encode('utf-8')
-                    client_socket.send(len(response_data).to_bytes(4, byteorder='big'))
-                    client_socket.send(response_data)
-                    session.bytes_sent += len(response_data) + 4
+                    response_data = self._handle_frame(message_data, session)
+                    session.bytes_sent += send_frame(client_socket, response_data)
                     
                 except json.JSONDecodeError:
                     self.logger.error("Invalid JSON received")
@@ -235,67 +358,120 @@ class QuantumSafeServer:
                 self.logger.error(f"Error in application data handling: {e}")
                 break
     
-    def _process_message(self, message: Dict[str, Any], 
-                        session: ConnectionSession) -> Dict[str, Any]:
-        """Process application messages"""
-        msg_type = message.get('type', 'unknown')
-        
-        if msg_type == 'ping':
-            return {
-                "type": "pong",
-                "timestamp": datetime.now().isoformat(),
-                "session_id": session.session_id
-            }
+    async def _handle_client_async(self, reader: asyncio.StreamReader,
+                                   writer: asyncio.StreamWriter):
+        """Handle one client connection as a coroutine on the event loop"""
+        client_address = writer.get_extra_info('peername')
+        session_id = secrets.token_hex(16)
+        self.logger.info(f"New connection from {client_address} - Session: {session_id}")
         
-        elif msg_type == 'echo':
-            return {
-                "type": "echo_response",
-                "data": message.get('data', ''),
-                "timestamp": datetime.now().isoformat(),
-                "session_id": session.session_id
-            }
+        try:
+            # The handshake is CPU-bound, so run it off the event loop to keep other
+            # connections responsive
+            session, response_data = await self._loop.run_in_executor(
+                None, self._establish_session, session_id, client_address)
+            writer.writelines((_FRAME_HEADER.pack(len(response_data)), response_data))
+            session.bytes_sent += len(response_data) + 4
+            await writer.drain()
+            
+            while self.running:
+                try:
+                    length_data = await asyncio.wait_for(reader.readexactly(4), self.config.timeout)
+                except asyncio.TimeoutError:
+                    continue
+                
+                message_length, = _FRAME_HEADER.unpack(length_data)
+                if message_length > 1024 * 1024:  # 1MB limit
+                    self.logger.warning("Message too large: %d bytes", message_length)
+                    break
+                
+                message_data = await reader.readexactly(message_length)
+                try:
+                    # Frames can trigger a full rekey handshake, so they are also handled off the loop
+                    response_data = await self._loop.run_in_executor(
+                        None, self._handle_frame, message_data, session)
+                except json.JSONDecodeError:
+                    self.logger.error("Invalid JSON received")
+                    break
+                
+                writer.writelines((_FRAME_HEADER.pack(len(response_data)), response_data))
+                session.bytes_sent += len(response_data) + 4
+                await writer.drain()
         
-        elif msg_type == 'crypto_info':
-            response = {
-                "type": "crypto_info_response",
-                "session_info": {
-                    "session_id": session.session_id,
-                    "established_time": session.established_time.isoformat(),
-                    "handshake_result": session.handshake_result,
-                    "bytes_sent": session.bytes_sent,
-                    "bytes_received": session.bytes_received
-                },
-                "server_config": {
-                    "mode": self.config.mode.value,
-                    "classical_alg": self.config.classical_alg.value,
-                    "pq_alg1": self.config.pq_alg1.value,
-                    "pq_alg2": self.config.pq_alg2.value if self.config.pq_alg2 else None,
-                    "signature_alg": self.config.signature_alg.value
-                }
-            }
-            return make_json_serializable(response)
+        except asyncio.IncompleteReadError:
+            pass
+        except Exception as e:
+            self.logger.error(f"Error handling client {client_address}: {e}")
+        finally:
+            writer.close()
+            self.sessions.pop(session_id, None)
+            self.logger.info(f"Connection closed for session {session_id}")
+    
+    def _process_message(self, message: Dict[str, Any], 
+                        session: ConnectionSession) -> Union[Dict[str, Any], bytes]:
+        """Process application messages
         
-        elif msg_type == 'rekey':
-            # Simulate rekeying process
-            new_handshake = self._create_handshake_handler(None, session.client_address)
-            new_result = new_handshake.perform_handshake()
-            
-            return {
-                "type": "rekey_response",
-                "status": "success",
-                "new_handshake": {
-                    "algorithms": new_result["algorithms"],
-                    "duration": new_result["handshake_duration"]
-                },
-                "timestamp": datetime.now().isoformat()
-            }
+        Responses spliced from pre-encoded parts are returned as bytes.
+        """
+        handler = getattr(self, self._MESSAGE_HANDLERS.get(message.get('type', 'unknown'),
+                                                           "_handle_unknown"))
+        return handler(message, session)
+    
+    def _handle_ping(self, message: Dict[str, Any], session: ConnectionSession) -> Dict[str, Any]:
+        return {
+            "type": "pong",
+            "timestamp": time.time_ns(),
+            "session_id": session.session_id
+        }
+    
+    def _handle_echo(self, message: Dict[str, Any], session: ConnectionSession) -> Dict[str, Any]:
+        return {
+            "type": "echo_response",
+            "data": message.get('data', ''),
+            "timestamp": time.time_ns(),
+            "session_id": session.session_id
+        }
+    
+    def _handle_crypto_info(self, message: Dict[str, Any], session: ConnectionSession) -> bytes:
+        session_info = encode_message({
+            "session_id": session.session_id,
+            "established_time": session.established_time.isoformat(),
+            "handshake_result": session.handshake_result,
+            "bytes_sent": session.bytes_sent,
+            "bytes_received": session.bytes_received
+        })
+        return (b'{"type":"crypto_info_response","session_info":' + session_info +
+                b',"server_config":' + self._server_config_json + b'}')
+    
+    def _handle_rekey(self, message: Dict[str, Any], session: ConnectionSession) -> Dict[str, Any]:
+        # Simulate rekeying process
+        new_handshake = self._create_handshake_handler(None, session.client_address)
+        new_result = new_handshake.perform_handshake()
         
-        else:
-            return {
-                "type": "error",
-                "message": f"Unknown message type: {msg_type}",
-                "timestamp": datetime.now().isoformat()
-            }
+        return {
+            "type": "rekey_response",
+            "status": "success",
+            "new_handshake": {
+                "algorithms": new_result["algorithms"],
+                "duration": new_result["handshake_duration"]
+            },
+            "timestamp": time.time_ns()
+        }
+    
+    def _handle_unknown(self, message: Dict[str, Any], session: ConnectionSession) -> Dict[str, Any]:
+        return {
+            "type": "error",
+            "message": f"Unknown message type: {message.get('type', 'unknown')}",
+            "timestamp": time.time_ns()
+        }
+    
+    # Handler method names, resolved on the instance so subclass overrides take effect
+    _MESSAGE_HANDLERS: Dict[str, str] = {
+        "ping": "_handle_ping",
+        "echo": "_handle_echo",
+        "crypto_info": "_handle_crypto_info",
+        "rekey": "_handle_rekey"
+    }
     
     def start(self):
         """Start the server"""
@@ -307,21 +483,33 @@ class QuantumSafeServer:
             self.server_socket.bind((self.config.host, self.config.port))
             self.server_socket.listen(self.config.max_connections)
             
+            # Handshakes need the certificate, so only report ready once it is issued
+            self._cert_future.result()
+            self.ready.set()
+            
             self.logger.info(f"Quantum-Safe server listening on {self.config.host}:{self.config.port}")
             self.logger.info(f"Server mode: {self.config.mode.value}")
             self.logger.info(f"Certificate algorithm: {self.config.signature_alg.value}")
             
+            # Connections hold a worker for their lifetime, so the pool is sized
+            # to max_connections and anything beyond that is refused immediately
+            self._pool = ThreadPoolExecutor(max_workers=self.config.max_connections,
+                                            thread_name_prefix=f"QSServer-{self.config.port}")
+            connection_slots = threading.BoundedSemaphore(self.config.max_connections)
+            
             while self.running:
                 try:
                     client_socket, client_address = self.server_socket.accept()
                     
-                    # Handle client in separate thread
-                    client_thread = threading.Thread(
-                        target=self._handle_client_connection,
-                        args=(client_socket, client_address),
-                        daemon=True
-                    )
-                    client_thread.start()
+                    if not connection_slots.acquire(blocking=False):
+                        self.logger.warning(f"Connection limit reached, rejecting {client_address}")
+                        client_socket.close()
+                        continue
+                    
+                    # Handle client on a pooled worker thread
+                    future = self._pool.submit(self._handle_client_connection,
+                                               client_socket, client_address)
+                    future.add_done_callback(lambda _: connection_slots.release())
                     
                 except Exception as e:
                     if self.running:
@@ -332,10 +520,57 @@ class QuantumSafeServer:
         finally:
             self.stop()
     
+    async def serve_async(self):
+        """Serve clients from a single asyncio event loop
+        
+        Alternative to start(): connections are coroutines rather than threads.
+        """
+        self.running = True
+        self._loop = asyncio.get_running_loop()
+        self._async_stop = asyncio.Event()
+        
+        server = await asyncio.start_server(
+            self._handle_client_async, self.config.host, self.config.port,
+            backlog=self.config.max_connections, reuse_address=True
+        )
+        
+        # Handshakes need the certificate, so only report ready once it is issued
+        await asyncio.wrap_future(self._cert_future)
+        self.ready.set()
+        self.logger.info(f"Quantum-Safe server listening on {self.config.host}:{self.config.port} (asyncio)")
+        self.logger.info(f"Server mode: {self.config.mode.value}")
+        self.logger.info(f"Certificate algorithm: {self.config.signature_alg.value}")
+        
+        async with server:
+            await self._async_stop.wait()
+    
+    def start_async(self):
+        """Start the asyncio server, blocking until stop() is called
+        
+        Runs on uvloop when it is installed, otherwise on the default loop.
+        """
+        loop = uvloop.new_event_loop() if UVLOOP_AVAILABLE else asyncio.new_event_loop()
+        try:
+            loop.run_until_complete(self.serve_async())
+        except Exception as e:
+            self.logger.error(f"Failed to start server: {e}")
+        finally:
+            loop.close()
+            self.stop()
+    
     def stop(self):
         """Stop the server"""
         self.running = False
+        if self._loop is not None and not self._loop.is_closed():
+            self._loop.call_soon_threadsafe(self._async_stop.set)
+        if self._pool is not None:
+            self._pool.shutdown(wait=False)
         if self.server_socket:
+            try:
+                # Wake a thread blocked in accept(); close() alone does not on Linux
+                self.server_socket.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
             try:
                 self.server_socket.close()
             except:
@@ -344,23 +579,30 @@ class QuantumSafeServer:
     
     def get_stats(self) -> Dict[str, Any]:
         """Get server statistics"""
+        # Snapshot once: handler threads add and remove sessions concurrently
+        sessions = list(self.sessions.values())
+        total_sent = 0
+        total_received = 0
+        session_stats = []
+        for s in sessions:
+            total_sent += s.bytes_sent
+            total_received += s.bytes_received
+            session_stats.append({
+                "session_id": s.session_id,
+                "client": f"{s.client_address[0]}:{s.client_address[1]}",
+                "established": s.established_time.isoformat(),
+                "last_activity": datetime.fromtimestamp(s.last_activity).isoformat(),
+                "algorithms": s.handshake_result.get("algorithms", []),
+                "bytes_sent": s.bytes_sent,
+                "bytes_received": s.bytes_received
+            })
+        
         return {
-            "active_sessions": len(self.sessions),
-            "total_bytes_sent": sum(s.bytes_sent for s in self.sessions.values()),
-            "total_bytes_received": sum(s.bytes_received for s in self.sessions.values()),
+            "active_sessions": len(sessions),
+            "total_bytes_sent": total_sent,
+            "total_bytes_received": total_received,
             "server_uptime": datetime.now().isoformat(),
-            "sessions": [
-                {
-                    "session_id": s.session_id,
-                    "client": f"{s.client_address[0]}:{s.client_address[1]}",
-                    "established": s.established_time.isoformat(),
-                    "last_activity": s.last_activity.isoformat(),
-                    "algorithms": s.handshake_result.get("algorithms", []),
-                    "bytes_sent": s.bytes_sent,
-                    "bytes_received": s.bytes_received
-                }
-                for s in self.sessions.values()
-            ]
+            "sessions": session_stats
         }
 
 class QuantumSafeClient:
@@ -373,31 +615,27 @@ class QuantumSafeClient:
         self.session_info = None
         
         # Setup logging
-        logging.basicConfig(level=logging.INFO,
-                          format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+        _configure_logging()
         self.logger = logging.getLogger("QSClient")
         
         # Create client certificate
-        self.client_cert_chain = self.signature_system.create_certificate_chain(
+        self._cert_future = _certificate_pool.submit(
+            self.signature_system.create_certificate_chain,
             f"QS-Client-{secrets.token_hex(8)}",
             config.signature_alg
         )
         
         self.logger.info(f"Client initialized with {config.mode.value} mode")
     
+    @property
+    def client_cert_chain(self) -> Dict[str, Any]:
+        """Client certificate chain, waiting for it to be issued if necessary"""
+        return self._cert_future.result()
+    
     def _create_handshake_handler(self) -> HybridTLSHandshake:
         """Create appropriate handshake handler based on client preferences"""
-        if self.config.mode == ConnectionMode.CLASSICAL:
-            exchange_type = KeyExchangeType.CLASSICAL
-        elif self.config.mode == ConnectionMode.HYBRID:
-            exchange_type = KeyExchangeType.DUAL_HYBRID
-        elif self.config.mode == ConnectionMode.PQ_ONLY:
-            exchange_type = KeyExchangeType.PQ_ONLY
-        else:  # AUTO_NEGOTIATE
-            exchange_type = KeyExchangeType.DUAL_HYBRID  # Default preference
-        
         return HybridTLSHandshake(
-            exchange_type=exchange_type,
+            exchange_type=_MODE_TO_EXCHANGE[self.config.mode],
             classical_alg=self.config.preferred_classical,
             pq_alg1=self.config.preferred_pq1,
             pq_alg2=self.config.preferred_pq2
@@ -408,6 +646,7 @@ class QuantumSafeClient:
         try:
             self.socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
             self.socket.settimeout(self.config.timeout)
+            _enable_nodelay(self.socket)
             
             self.logger.info(f"Connecting to {self.config.server_host}:{self.config.server_port}")
             self.socket.connect((self.config.server_host, self.config.server_port))
@@ -421,15 +660,18 @@ class QuantumSafeClient:
             self.logger.info(f"Client-side handshake completed in {handshake_duration:.3f}s")
             
             # Receive server handshake confirmation
-            length_data = self.socket.recv(4)
-            message_length = int.from_bytes(length_data, byteorder='big')
+            length_data = recv_exact(self.socket, 4)
+            if length_data is None:
+                self.logger.error("Connection closed during handshake")
+                return False
+            message_length, = _FRAME_HEADER.unpack(length_data)
             
-            response_data = b""
-            while len(response_data) < message_length:
-                chunk = self.socket.recv(min(message_length - len(response_data), 4096))
-                response_data += chunk
+            response_data = recv_exact(self.socket, message_length)
+            if response_data is None:
+                self.logger.error("Connection closed during handshake")
+                return False
             
-            self.session_info = json.loads(response_data.decode('utf-8'))
+            self.session_info = decode_message(response_data)
             
             if self.session_info.get("status") == "handshake_complete":
                 self.logger.info(f"Connected! Session ID: {self.session_info['session_id']}")
@@ -452,27 +694,23 @@ class QuantumSafeClient:
         
         try:
             # Send message
-            message_data = json.dumps(message).encode('utf-8')
-            self.socket.send(len(message_data).to_bytes(4, byteorder='big'))
-            self.socket.send(message_data)
+            message_data = encode_message(message)
+            send_frame(self.socket, message_data)
             
             # Receive response
-            length_data = self.socket.recv(4)
-            if not length_data:
+            length_data = recv_exact(self.socket, 4)
+            if length_data is None:
                 self.logger.error("Connection closed by server")
                 return None
             
-            message_length = int.from_bytes(length_data, byteorder='big')
+            message_length, = _FRAME_HEADER.unpack(length_data)
             
-            response_data = b""
-            while len(response_data) < message_length:
-                chunk = self.socket.recv(min(message_length - len(response_data), 4096))
-                if not chunk:
-                    self.logger.error("Incomplete response received")
-                    return None
-                response_data += chunk
+            response_data = recv_exact(self.socket, message_length)
+            if response_data is None:
+                self.logger.error("Incomplete response received")
+                return None
             
-            return json.loads(response_data.decode('utf-8'))
+            return decode_message(response_data)
         
         except Exception as e:
             self.logger.error(f"Error sending message: {e}")
@@ -569,48 +807,52 @@ class CryptoAgilityDemo:
             }
         ]
     
-    def run_demo(self, port_base: int = 9000) -> Dict[str, Any]:
-        """Run crypto-agility demonstration"""
-        results = {}
+    def run_demo(self, port_base: int = 9000, workers: Optional[int] = None) -> Dict[str, Any]:
+        """Run crypto-agility demonstration
         
-        for i, config in enumerate(self.test_configs):
-            port = port_base + i
-            config_name = config["name"]
-            
-            self.logger.info(f"\n{'='*50}")
-            self.logger.info(f"Testing: {config_name}")
-            self.logger.info(f"{'='*50}")
-            
-            # Create server configuration
-            server_config = ServerConfig(
-                port=port,
+        Each configuration uses its own port, so up to ``workers`` of them
+        (default: all) are tested concurrently.
+        """
+        # Create every server up front so their certificates are issued concurrently
+        servers = [
+            QuantumSafeServer(ServerConfig(
+                port=port_base + i,
                 mode=config["server_mode"],
                 classical_alg=config["classical_alg"],
                 pq_alg1=config["pq_alg1"],
                 signature_alg=config["signature_alg"]
-            )
-            
-            # Create client configuration
-            client_config = ClientConfig(
-                server_port=port,
-                mode=config["client_mode"],
-                preferred_classical=config["classical_alg"],
-                preferred_pq1=config["pq_alg1"],
-                signature_alg=config["signature_alg"]
-            )
-            
-            # Test this configuration
-            test_result = self._test_configuration(server_config, client_config)
-            results[config_name] = test_result
-            
-            # Brief pause between tests
-            time.sleep(1)
+            ))
+            for i, config in enumerate(self.test_configs)
+        ]
         
-        return results
+        with ThreadPoolExecutor(max_workers=workers or len(self.test_configs)) as executor:
+            futures = {}
+            for config, server in zip(self.test_configs, servers):
+                config_name = config["name"]
+                
+                self.logger.info(f"\n{'='*50}")
+                self.logger.info(f"Testing: {config_name}")
+                self.logger.info(f"{'='*50}")
+                
+                # Create client configuration
+                client_config = ClientConfig(
+                    server_port=server.config.port,
+                    mode=config["client_mode"],
+                    preferred_classical=config["classical_alg"],
+                    preferred_pq1=config["pq_alg1"],
+                    signature_alg=config["signature_alg"]
+                )
+                
+                # Test this configuration
+                futures[config_name] = executor.submit(
+                    self._test_configuration, server.config, client_config, server)
+            
+            return {name: future.result() for name, future in futures.items()}
     
     def _test_configuration(self, server_config: ServerConfig, 
-                          client_config: ClientConfig) -> Dict[str, Any]:
-        """Test a specific configuration"""
+                          client_config: ClientConfig,
+                          server: Optional[QuantumSafeServer] = None) -> Dict[str, Any]:
+        """Test a specific configuration, optionally on an already constructed server"""
         result = {
             "success": False,
             "error": None,
@@ -620,17 +862,17 @@ class CryptoAgilityDemo:
             "algorithms_used": None
         }
         
-        server = None
         server_thread = None
         
         try:
             # Start server
-            server = QuantumSafeServer(server_config)
+            if server is None:
+                server = QuantumSafeServer(server_config)
             server_thread = threading.Thread(target=server.start, daemon=True)
             server_thread.start()
             
-            # Give server time to start
-            time.sleep(0.5)
+            # Wait until the server is listening
+            server.ready.wait(timeout=5)
             
             # Create and connect client
             client = QuantumSafeClient(client_config)
@@ -663,7 +905,7 @@ class CryptoAgilityDemo:
                 client.disconnect()
                 result["success"] = True
                 
-                self.logger.info(f"✓ Configuration test successful")
+                self.logger.info(f"✓ Configuration test successful ({server_config.mode.value})")
                 self.logger.info(f"  Handshake time: {handshake_time:.3f}s")
                 self.logger.info(f"  Ping time: {ping_time:.3f}s" if ping_time else "  Ping: Failed")
                 self.logger.info(f"  Algorithms: {', '.join(result['algorithms_used']) if result['algorithms_used'] else 'None'}")
@@ -682,8 +924,21 @@ class CryptoAgilityDemo:
         
         return result
 
+# Row layout of the crypto-agility summary table
+_SUMMARY_ROW = "{name:<20} {ok:<8} {hs:<12} {ping:<10} {algs}\n"
+
 # Example usage and testing
-if __name__ == "__main__":
+def main():
+    """Run the client-server and crypto-agility demonstrations"""
+    # Step results go through logging so callers can silence them by level
+    log = logging.getLogger(__name__)
+    if not log.handlers:
+        handler = logging.StreamHandler(sys.stdout)
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        log.addHandler(handler)
+        log.setLevel(logging.INFO)
+        log.propagate = False
+    
     print("=== Quantum-Safe Client-Server Demo ===\n")
     
     # Demo 1: Basic Server-Client Communication
@@ -711,53 +966,56 @@ if __name__ == "__main__":
     server_thread = threading.Thread(target=server.start, daemon=True)
     server_thread.start()
     
-    # Give server time to start
-    time.sleep(1)
+    # Wait until the server is listening
+    server.ready.wait(timeout=5)
     
     try:
         # Connect client
         client = QuantumSafeClient(client_config)
         
         if client.connect():
-            print("✓ Client connected successfully")
+            log.info("✓ Client connected successfully")
             
             # Test ping
             ping_time = client.ping()
             if ping_time:
-                print(f"✓ Ping successful: {ping_time*1000:.2f}ms")
+                log.info("✓ Ping successful: %.2fms", ping_time * 1000)
             
             # Test echo
             echo_response = client.echo("Hello, Quantum-Safe Server!")
             if echo_response:
-                print(f"✓ Echo successful: '{echo_response}'")
+                log.info("✓ Echo successful: '%s'", echo_response)
             
             # Get crypto information
             crypto_info = client.get_crypto_info()
-            if crypto_info:
-                session_info = crypto_info["session_info"]
-                print(f"✓ Session ID: {session_info['session_id']}")
-                print(f"  Algorithms: {', '.join(session_info['handshake_result']['algorithms'])}")
-                print(f"  Exchange type: {session_info['handshake_result']['exchange_type']}")
-                print(f"  Handshake duration: {session_info['handshake_result']['handshake_duration']:.3f}s")
             
-            # Test rekey
-            if client.rekey():
-                print("✓ Rekey operation successful")
+            # Test rekey; the round trip runs while the session details are printed
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                rekey_future = executor.submit(client.rekey)
+                
+                if crypto_info:
+                    session_info = crypto_info["session_info"]
+                    handshake_result = session_info["handshake_result"]
+                    log.info("✓ Session ID: %s", session_info['session_id'])
+                    log.info("  Algorithms: %s", ', '.join(handshake_result['algorithms']))
+                    log.info("  Exchange type: %s", handshake_result['exchange_type'])
+                    log.info("  Handshake duration: %.3fs", handshake_result['handshake_duration'])
+                
+                if rekey_future.result():
+                    log.info("✓ Rekey operation successful")
             
             client.disconnect()
-            print("✓ Client disconnected")
+            log.info("✓ Client disconnected")
         
         else:
-            print("✗ Client connection failed")
+            log.error("✗ Client connection failed")
     
     except Exception as e:
-        print(f"✗ Demo 1 failed: {e}")
+        log.error("✗ Demo 1 failed: %s", e)
     
     finally:
         server.stop()
-    
-    # Brief pause
-    time.sleep(2)
+        server_thread.join(timeout=5)
     
     # Demo 2: Crypto-Agility Demonstration
     print("\n2. Crypto-Agility Demonstration")
@@ -767,21 +1025,34 @@ if __name__ == "__main__":
     demo_results = demo.run_demo(port_base=9000)
     
     print("\n=== Demo Results Summary ===")
-    print(f"{'Configuration':<20} {'Success':<8} {'Handshake(s)':<12} {'Ping(ms)':<10} {'Algorithms'}")
+    sys.stdout.write(_SUMMARY_ROW.format(name="Configuration", ok="Success", hs="Handshake(s)",
+                                         ping="Ping(ms)", algs="Algorithms"))
     print("-" * 80)
     
+    rows = []
     for config_name, result in demo_results.items():
-        success = "✓" if result["success"] else "✗"
-        handshake = f"{result['handshake_time']:.3f}" if result["handshake_time"] else "N/A"
-        ping = f"{result['ping_time']*1000:.2f}" if result["ping_time"] else "N/A"
+        ok, error = result["success"], result["error"]
+        handshake_time, ping_time = result["handshake_time"], result["ping_time"]
         algorithms = ", ".join(result["algorithms_used"]) if result["algorithms_used"] else "N/A"
         
-        print(f"{config_name:<20} {success:<8} {handshake:<12} {ping:<10} {algorithms[:30]}")
+        rows.append(_SUMMARY_ROW.format_map({
+            "name": config_name,
+            "ok": "✓" if ok else "✗",
+            "hs": f"{handshake_time:.3f}" if handshake_time else "N/A",
+            "ping": f"{ping_time*1000:.2f}" if ping_time else "N/A",
+            "algs": algorithms[:30]
+        }))
         
-        if not result["success"] and result["error"]:
-            print(f"{'Error:':<20} {result['error']}")
+        if not ok and error:
+            rows.append(f"{'Error:':<20} {error}\n")
+    
+    # Emit the whole table in one write
+    sys.stdout.write("".join(rows))
     
     print("\n=== Demo Complete ===")
     print("The demonstration shows how the system can seamlessly switch between")
     print("different cryptographic configurations without code changes, demonstrating")
     print("true crypto-agility for post-quantum migration scenarios.")
+
+if __name__ == "__main__":
+    main()
@@ -3,15 +3,20 @@ Extended Post-Quantum Algorithm Support
 Implements additional NIST candidates and alternative PQ schemes beyond the core algorithms
 """
 
+import os
+import sys
 import secrets
 import hashlib
 import time
 import numpy as np
 from typing import Dict, List, Optional, Tuple, Any, Union
 from enum import Enum
-from dataclasses import dataclass
+from dataclasses import dataclass, fields
+from functools import lru_cache
 from datetime import datetime
 import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
 
 # Try to import additional cryptographic libraries
 try:
@@ -21,6 +26,68 @@ try:
 except ImportError:
     PYCRYPTO_AVAILABLE = False
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Inputs may be any contiguous byte buffer; they are hashed incrementally, never concatenated
+BytesLike = Union[bytes, bytearray, memoryview]
+
+def _random_keypair(public_key_size: int, private_key_size: int) -> Tuple[bytes, bytes]:
+    """Draw public and private key material with a single OS RNG call"""
+    material = os.urandom(public_key_size + private_key_size)
+    return material[:public_key_size], material[public_key_size:]
+
+def _derive_shared_secret(ciphertext: bytes, private_key: bytes, size: int) -> bytes:
+    """Derive a simulated shared secret without concatenating the inputs"""
+    kdf = hashlib.blake2b(digest_size=size)
+    kdf.update(ciphertext)
+    kdf.update(private_key)
+    return kdf.digest()
+
+# Big-endian counter encodings for the SPHINCS+ expansion loop, which hashes one
+# counter per 32-byte output block (the counter is the block's byte offset).
+# Covers signatures up to 64 KiB; the largest parameter set is 49856 bytes.
+_BLOCK_COUNTERS = tuple(offset.to_bytes(4, 'big') for offset in range(0, 1 << 16, 32))
+
+def _select_sha256():
+    """Pick the faster SHA-256 constructor available on this host"""
+    if not PYCRYPTO_AVAILABLE:
+        return hashlib.sha256
+    
+    # PyCryptodome can use the SHA extensions where OpenSSL's build does not;
+    # time a bulk hash plus the copy-and-extend pattern used when signing
+    sample = bytes(16 * 1024)
+    timings = {}
+    for constructor in (hashlib.sha256, SHA256.new):
+        start = time.perf_counter()
+        for _ in range(4):
+            constructor(sample).digest()
+        prefix = constructor(sample[:96])
+        for _ in range(64):
+            counter_hash = prefix.copy()
+            counter_hash.update(b"\x00\x00\x00\x00")
+            counter_hash.digest()
+        timings[constructor] = time.perf_counter() - start
+    return min(timings, key=timings.get)
+
+_sha256 = _select_sha256()
+
+# SHA-3 message hash constructors keyed by parameter-set hash_function name
+_SHA3 = {
+    "SHA3-224": hashlib.sha3_224,
+    "SHA3-256": hashlib.sha3_256,
+    "SHA3-384": hashlib.sha3_384
+}
+
+def _size_only_verifier(signature_size: int, public_key_size: int):
+    """Build a verify function specialized to fixed signature and public key sizes"""
+    def verify(message: BytesLike, signature: BytesLike, public_key: BytesLike) -> bool:
+        return len(signature) == signature_size and len(public_key) == public_key_size
+    return verify
+
 class PQAlgorithmFamily(Enum):
     """Post-quantum algorithm families"""
     LATTICE_BASED = "lattice"
@@ -30,15 +97,23 @@ class PQAlgorithmFamily(Enum):
     ISOGENY_BASED = "isogeny"  # Note: SIKE was broken
     SYMMETRIC = "symmetric"
 
+# Default family filter for recommendations, built once instead of per call
+_ALL_FAMILIES = frozenset(PQAlgorithmFamily)
+
 class SecurityLevel(Enum):
     """NIST security levels"""
     LEVEL_1 = 1  # Equivalent to AES-128
     LEVEL_3 = 3  # Equivalent to AES-192
     LEVEL_5 = 5  # Equivalent to AES-256
 
-@dataclass
+@dataclass(frozen=True)
 class AlgorithmParameters:
     """Parameters for a post-quantum algorithm"""
+    # Declared by hand rather than with dataclass(slots=True) to keep Python 3.8 support
+    __slots__ = ("name", "family", "security_level", "key_sizes",
+                 "performance_characteristics", "standardization_status", "implementation_notes",
+                 "public_key_size", "private_key_size", "signature_size", "ciphertext_size")
+    
     name: str
     family: PQAlgorithmFamily
     security_level: SecurityLevel
@@ -46,6 +121,22 @@ class AlgorithmParameters:
     performance_characteristics: Dict[str, Any]
     standardization_status: str  # "NIST_Standard", "NIST_Candidate", "Alternative"
     implementation_notes: str
+    
+    def __post_init__(self):
+        # Integer copies of key_sizes in the *_size slots (0 when a size doesn't apply),
+        # so hot paths read an attribute instead of calling key_sizes.get()
+        for size_name in ("public_key", "private_key", "signature", "ciphertext"):
+            object.__setattr__(self, f"{size_name}_size", self.key_sizes.get(size_name, 0))
+    
+    # Frozen dataclasses with __slots__ have no __dict__ for pickle and copy to restore,
+    # and their default slot restore goes through the blocked __setattr__
+    def __getstate__(self):
+        return tuple(getattr(self, f.name) for f in fields(self))
+    
+    def __setstate__(self, state):
+        for f, value in zip(fields(self), state):
+            object.__setattr__(self, f.name, value)
+        self.__post_init__()
 
 class ExtendedNTRUImplementation:
     """Extended NTRU implementation with multiple parameter sets"""
@@ -93,16 +184,56 @@ class ExtendedNTRUImplementation:
             raise ValueError(f"Unknown NTRU parameter set: {parameter_set}")
         
         self.params = self.parameters[parameter_set]
-    
-    def generate_keypair(self) -> Tuple[bytes, bytes]:
-        """Generate NTRU key pair (simulation)"""
-        # In a real implementation, this would generate proper NTRU lattice keys
-        public_key = secrets.token_bytes(self.params["public_key_size"])
-        private_key = secrets.token_bytes(self.params["private_key_size"])
         
-        return public_key, private_key
+        # Packing layout for this parameter set: public key coefficients take
+        # log2(q) bits each, private polynomials are packed five trits per byte
+        self._coefficient_bits = self.params["q"].bit_length() - 1
+        self._bit_shifts = np.arange(self._coefficient_bits, dtype=np.int64)
+        self._trit_weights = np.array([1, 3, 9, 27, 81], dtype=np.int64)
+    
+    def _sample_ternary(self, count: int) -> np.ndarray:
+        """Sample count polynomials with coefficients in {-1, 0, 1}, one per row"""
+        n = self.params["n"]
+        coefficients = np.frombuffer(os.urandom(count * n), dtype=np.uint8).reshape(count, n)
+        return coefficients.astype(np.int64) % 3 - 1
+    
+    def _ring_multiply(self, a: np.ndarray, b: np.ndarray) -> np.ndarray:
+        """Multiply polynomials row-wise in Z_q[x]/(x^n - 1) using an FFT cyclic convolution"""
+        n = self.params["n"]
+        product = np.fft.irfft(np.fft.rfft(a) * np.fft.rfft(b), n)
+        return np.rint(product).astype(np.int64) % self.params["q"]
+    
+    def _pack_coefficients(self, polys: np.ndarray) -> np.ndarray:
+        """Pack the first n-1 coefficients of each row mod q at log2(q) bits each"""
+        bits = (polys[:, :-1, None] >> self._bit_shifts) & 1
+        return np.packbits(bits.astype(np.uint8).reshape(len(polys), -1), axis=1, bitorder="little")
+    
+    def _pack_ternary(self, polys: np.ndarray) -> np.ndarray:
+        """Pack the first n-1 ternary coefficients of each row five to a byte"""
+        trits = np.pad(polys[:, :-1] % 3, ((0, 0), (0, -(polys.shape[1] - 1) % 5)))
+        return (trits.reshape(len(polys), -1, 5) @ self._trit_weights).astype(np.uint8)
     
-    def encapsulate(self, public_key: bytes) -> Tuple[bytes, bytes]:
+    def generate_keypair(self) -> Tuple[bytes, bytes]:
+        """Generate NTRU key pair (simplified ring arithmetic)"""
+        return self._generate_keypairs(1)[0]
+    
+    def _generate_keypairs(self, count: int) -> List[Tuple[bytes, bytes]]:
+        """Generate count NTRU key pairs with the ring arithmetic vectorized across the batch"""
+        # Sample the short secret polynomials f and g and compute h = 3*g*f mod q.
+        # A full implementation uses the inverse of f mod q here; the simplified
+        # version keeps the same ring multiplication cost and key layout.
+        f = self._sample_ternary(count)
+        g = self._sample_ternary(count)
+        h = 3 * self._ring_multiply(g, f) % self.params["q"]
+        
+        public_keys = self._pack_coefficients(h)
+        seeds = np.frombuffer(os.urandom(32 * count), dtype=np.uint8).reshape(count, 32)
+        private_keys = np.hstack([self._pack_ternary(f), self._pack_ternary(g), public_keys, seeds])
+        
+        return [(public_key.tobytes(), private_key.tobytes())
+                for public_key, private_key in zip(public_keys, private_keys)]
+    
+    def encapsulate(self, public_key: BytesLike) -> Tuple[bytes, bytes]:
         """NTRU encapsulation (simulation)"""
         if len(public_key) != self.params["public_key_size"]:
             raise ValueError("Invalid public key size")
@@ -112,7 +243,7 @@ class ExtendedNTRUImplementation:
         
         return ciphertext, shared_secret
     
-    def decapsulate(self, ciphertext: bytes, private_key: bytes) -> bytes:
+    def decapsulate(self, ciphertext: BytesLike, private_key: BytesLike) -> bytes:
         """NTRU decapsulation (simulation)"""
         if len(ciphertext) != self.params["ciphertext_size"]:
             raise ValueError("Invalid ciphertext size")
@@ -120,7 +251,7 @@ class ExtendedNTRUImplementation:
             raise ValueError("Invalid private key size")
         
         # In simulation, return consistent shared secret
-        return hashlib.sha256(ciphertext + private_key).digest()[:32]
+        return _derive_shared_secret(ciphertext, private_key, 32)
 
 class SPHINCSPlusImplementation:
     """SPHINCS+ implementation with multiple parameter sets"""
@@ -186,54 +317,84 @@ class SPHINCSPlusImplementation:
             raise ValueError(f"Unknown SPHINCS+ parameter set: {parameter_set}")
         
         self.params = self.parameters[parameter_set]
+        
+        # Sizes and hash function are fixed per parameter set; resolve them once
+        self._public_key_size = self.params["public_key_size"]
+        self._private_key_size = self.params["private_key_size"]
+        self._signature_size = self.params["signature_size"]
+        # SHA-256 only yields 32 bytes, so the SHA256 sets derive their public key
+        # with BLAKE2b, which produces the full 48/64-byte keys of the larger sets
+        public_key_hashes = {
+            "SHA256": lambda seed: hashlib.blake2b(seed, digest_size=self._public_key_size).digest(),
+            "SHAKE256": lambda seed: hashlib.shake_256(seed).digest(self._public_key_size)
+        }
+        self._derive_public_key = public_key_hashes[self.params["hash_function"]]
+        signature_expanders = {
+            "SHA256": self._expand_signature_sha256,
+            "SHAKE256": self._expand_signature_shake256
+        }
+        self._expand_signature = signature_expanders[self.params["hash_function"]]
     
     def generate_keypair(self) -> Tuple[bytes, bytes]:
         """Generate SPHINCS+ key pair (simulation)"""
         # SPHINCS+ uses a random seed to generate the key pair
-        seed = secrets.token_bytes(self.params["private_key_size"])
+        seed = secrets.token_bytes(self._private_key_size)
         
         # Public key is derived from private key
-        if self.params["hash_function"] == "SHA256":
-            public_key = hashlib.sha256(seed).digest()[:self.params["public_key_size"]]
-        else:  # SHAKE256
-            public_key = hashlib.shake_256(seed).digest(self.params["public_key_size"])
+        public_key = self._derive_public_key(seed)
         
         return public_key, seed
     
-    def sign(self, message: bytes, private_key: bytes) -> bytes:
+    def sign(self, message: BytesLike, private_key: BytesLike) -> bytes:
         """SPHINCS+ signature generation (simulation)"""
-        if len(private_key) != self.params["private_key_size"]:
+        if len(private_key) != self._private_key_size:
             raise ValueError("Invalid private key size")
         
         # In a real implementation, this would perform the SPHINCS+ signing process
         # involving multiple hash tree levels and Winternitz one-time signatures
         
-        message_hash = hashlib.sha256(message).digest()
-        signature_material = private_key + message_hash
+        message_hash = _sha256(message).digest()
         
         # Generate signature of appropriate size
-        signature = bytearray()
-        for i in range(0, self.params["signature_size"], 32):
-            chunk = hashlib.sha256(signature_material + i.to_bytes(4, 'big')).digest()
-            signature.extend(chunk[:min(32, self.params["signature_size"] - len(signature))])
+        return self._expand_signature(private_key, message_hash)
+    
+    def _expand_signature_shake256(self, private_key: bytes, message_hash: bytes) -> bytes:
+        """Expand the signing material with a single SHAKE256 XOF call"""
+        xof = hashlib.shake_256(private_key)
+        xof.update(message_hash)
+        return xof.digest(self._signature_size)
+    
+    def _expand_signature_sha256(self, private_key: bytes, message_hash: bytes) -> bytes:
+        """Expand the signing material with counter-mode SHA-256"""
+        # The key/message prefix is constant, so hash it once and copy the state per counter
+        prefix = _sha256(private_key)
+        prefix.update(message_hash)
+        
+        # Fill a preallocated buffer in place rather than growing it chunk by chunk;
+        # whole 32-byte blocks first, then the partial tail block if there is one
+        signature_size = self._signature_size
+        full_size = signature_size - signature_size % 32
+        signature = bytearray(signature_size)
+        for i, counter in zip(range(0, full_size, 32), _BLOCK_COUNTERS):
+            counter_hash = prefix.copy()
+            counter_hash.update(counter)
+            signature[i:i + 32] = counter_hash.digest()
+        if full_size < signature_size:
+            counter_hash = prefix.copy()
+            counter_hash.update(_BLOCK_COUNTERS[full_size // 32])
+            signature[full_size:] = counter_hash.digest()[:signature_size - full_size]
         
         return bytes(signature)
     
-    def verify(self, message: bytes, signature: bytes, public_key: bytes) -> bool:
+    def verify(self, message: BytesLike, signature: BytesLike, public_key: BytesLike) -> bool:
         """SPHINCS+ signature verification (simulation)"""
-        if len(signature) != self.params["signature_size"]:
+        if len(signature) != self._signature_size:
             return False
-        if len(public_key) != self.params["public_key_size"]:
+        if len(public_key) != self._public_key_size:
             return False
         
-        # In simulation, perform basic consistency checks
-        message_hash = hashlib.sha256(message).digest()
-        
-        # Verify signature format and basic properties
-        if len(signature) == self.params["signature_size"]:
-            return True  # Simplified verification for simulation
-        
-        return False
+        # In simulation, the size checks above are the only verification performed
+        return True
 
 class FrodoKEMImplementation:
     """FrodoKEM implementation - Learning with Errors based KEM"""
@@ -282,12 +443,9 @@ class FrodoKEMImplementation:
     
     def generate_keypair(self) -> Tuple[bytes, bytes]:
         """Generate FrodoKEM key pair (simulation)"""
-        public_key = secrets.token_bytes(self.params["public_key_size"])
-        private_key = secrets.token_bytes(self.params["private_key_size"])
-        
-        return public_key, private_key
+        return _random_keypair(self.params["public_key_size"], self.params["private_key_size"])
     
-    def encapsulate(self, public_key: bytes) -> Tuple[bytes, bytes]:
+    def encapsulate(self, public_key: BytesLike) -> Tuple[bytes, bytes]:
         """FrodoKEM encapsulation (simulation)"""
         if len(public_key) != self.params["public_key_size"]:
             raise ValueError("Invalid public key size")
@@ -297,7 +455,7 @@ class FrodoKEMImplementation:
         
         return ciphertext, shared_secret
     
-    def decapsulate(self, ciphertext: bytes, private_key: bytes) -> bytes:
+    def decapsulate(self, ciphertext: BytesLike, private_key: BytesLike) -> bytes:
         """FrodoKEM decapsulation (simulation)"""
         if len(ciphertext) != self.params["ciphertext_size"]:
             raise ValueError("Invalid ciphertext size")
@@ -305,7 +463,7 @@ class FrodoKEMImplementation:
             raise ValueError("Invalid private key size")
         
         # Return consistent shared secret for simulation
-        return hashlib.sha256(ciphertext + private_key).digest()[:self.params["shared_secret_size"]]
+        return _derive_shared_secret(ciphertext, private_key, self.params["shared_secret_size"])
 
 class McElieceImplementation:
     """Classic McEliece implementation - Code-based cryptography"""
@@ -355,12 +513,9 @@ class McElieceImplementation:
     def generate_keypair(self) -> Tuple[bytes, bytes]:
         """Generate McEliece key pair (simulation)"""
         # McEliece has very large public keys due to the generator matrix
-        public_key = secrets.token_bytes(self.params["public_key_size"])
-        private_key = secrets.token_bytes(self.params["private_key_size"])
-        
-        return public_key, private_key
+        return _random_keypair(self.params["public_key_size"], self.params["private_key_size"])
     
-    def encapsulate(self, public_key: bytes) -> Tuple[bytes, bytes]:
+    def encapsulate(self, public_key: BytesLike) -> Tuple[bytes, bytes]:
         """McEliece encapsulation (simulation)"""
         if len(public_key) != self.params["public_key_size"]:
             raise ValueError("Invalid public key size")
@@ -370,14 +525,14 @@ class McElieceImplementation:
         
         return ciphertext, shared_secret
     
-    def decapsulate(self, ciphertext: bytes, private_key: bytes) -> bytes:
+    def decapsulate(self, ciphertext: BytesLike, private_key: BytesLike) -> bytes:
         """McEliece decapsulation (simulation)"""
         if len(ciphertext) != self.params["ciphertext_size"]:
             raise ValueError("Invalid ciphertext size")
         if len(private_key) != self.params["private_key_size"]:
             raise ValueError("Invalid private key size")
         
-        return hashlib.sha256(ciphertext + private_key).digest()[:self.params["shared_secret_size"]]
+        return _derive_shared_secret(ciphertext, private_key, self.params["shared_secret_size"])
 
 class RainbowImplementation:
     """Rainbow multivariate signature scheme (Note: Rainbow was broken in 2022)"""
@@ -412,6 +567,10 @@ class RainbowImplementation:
             raise ValueError(f"Unknown Rainbow parameter set: {parameter_set}")
         
         self.params = self.parameters[parameter_set]
+        
+        # verify(message, signature, public_key) is only a size check, so it is bound
+        # per instance as a closure over the fixed sizes instead of defined as a method
+        self.verify = _size_only_verifier(self.params["signature_size"], self.params["public_key_size"])
     
     def generate_keypair(self) -> Tuple[bytes, bytes]:
         """Generate Rainbow key pair (simulation - BROKEN ALGORITHM)"""
@@ -420,17 +579,14 @@ class RainbowImplementation:
         
         return public_key, private_key
     
-    def sign(self, message: bytes, private_key: bytes) -> bytes:
+    def sign(self, message: BytesLike, private_key: BytesLike) -> bytes:
         """Rainbow signature (simulation - BROKEN ALGORITHM)"""
-        message_hash = hashlib.sha256(message).digest()
-        signature_material = private_key + message_hash
+        message_hash = _sha256(message).digest()
+        signature_hash = _sha256(private_key)
+        signature_hash.update(message_hash)
         
         # Generate signature of appropriate size
-        return hashlib.sha256(signature_material).digest()[:self.params["signature_size"]]
-    
-    def verify(self, message: bytes, signature: bytes, public_key: bytes) -> bool:
-        """Rainbow verification (simulation - BROKEN ALGORITHM)"""
-        return len(signature) == self.params["signature_size"] and len(public_key) == self.params["public_key_size"]
+        return signature_hash.digest()[:self.params["signature_size"]]
 
 class GeMSSImplementation:
     """GeMSS multivariate signature scheme"""
@@ -473,6 +629,11 @@ class GeMSSImplementation:
             raise ValueError(f"Unknown GeMSS parameter set: {parameter_set}")
         
         self.params = self.parameters[parameter_set]
+        self._msg_hash = _SHA3[self.params["hash_function"]]
+        
+        # verify(message, signature, public_key) is only a size check, so it is bound
+        # per instance as a closure over the fixed sizes instead of defined as a method
+        self.verify = _size_only_verifier(self.params["signature_size"], self.params["public_key_size"])
     
     def generate_keypair(self) -> Tuple[bytes, bytes]:
         """Generate GeMSS key pair (simulation)"""
@@ -481,38 +642,84 @@ class GeMSSImplementation:
         
         return public_key, private_key
     
-    def sign(self, message: bytes, private_key: bytes) -> bytes:
+    def sign(self, message: BytesLike, private_key: BytesLike) -> bytes:
         """GeMSS signature (simulation)"""
-        # Use appropriate hash function
-        if self.params["hash_function"] == "SHA3-224":
-            message_hash = hashlib.sha3_224(message).digest()
-        elif self.params["hash_function"] == "SHA3-256":
-            message_hash = hashlib.sha3_256(message).digest()
-        else:  # SHA3-384
-            message_hash = hashlib.sha3_384(message).digest()
-        
-        signature_material = private_key + message_hash
-        return hashlib.sha256(signature_material).digest()[:self.params["signature_size"]]
-    
-    def verify(self, message: bytes, signature: bytes, public_key: bytes) -> bool:
-        """GeMSS verification (simulation)"""
-        return len(signature) == self.params["signature_size"] and len(public_key) == self.params["public_key_size"]
+        # Use the parameter set's hash function, resolved in __init__
+        message_hash = self._msg_hash(message).digest()
+        
+        signature_hash = _sha256(private_key)
+        signature_hash.update(message_hash)
+        return signature_hash.digest()[:self.params["signature_size"]]
 
 class ExtendedAlgorithmRegistry:
     """Registry for extended post-quantum algorithms"""
     
     def __init__(self):
-        self.algorithms = {}
-        self._initialize_algorithms()
+        # The table only depends on the static parameter sets, so it is built once
+        # and each registry gets its own shallow copy
+        self.algorithms = dict(self._build_algorithm_table())
+        
+        # Inverted indices so the list_* lookups don't rescan the whole table
+        self._by_family: Dict[PQAlgorithmFamily, List[str]] = {}
+        self._by_level: Dict[SecurityLevel, List[str]] = {}
+        self._by_status: Dict[str, List[str]] = {}
+        for name, params in self.algorithms.items():
+            self._by_family.setdefault(params.family, []).append(name)
+            self._by_level.setdefault(params.security_level, []).append(name)
+            self._by_status.setdefault(params.standardization_status, []).append(name)
+        
+        self._build_recommendation_rows()
+        self._recommendation_cache: Dict[frozenset, List[Tuple[str, str]]] = {}
     
-    def _initialize_algorithms(self):
-        """Initialize algorithm registry with all supported algorithms"""
+    def _build_recommendation_rows(self):
+        """Precompute the fields recommend_algorithms filters on, in recommendation order"""
+        status_ranks = {"NIST_Standard": 0, "NIST_Candidate": 1}
+        rows = []
+        for name, params in self.algorithms.items():
+            score_factors = []
+            
+            # Prefer NIST standards
+            if params.standardization_status == "NIST_Standard":
+                score_factors.append("NIST_Standard")
+            elif params.standardization_status == "NIST_Candidate":
+                score_factors.append("NIST_Candidate")
+            
+            # Consider performance characteristics
+            perf = params.performance_characteristics
+            if perf.get("key_generation") == "fast":
+                score_factors.append("fast_keygen")
+            if perf.get("signing") == "fast" or perf.get("encapsulation") == "fast":
+                score_factors.append("fast_crypto_ops")
+            
+            # Prefer smaller key sizes
+            public_key_size = params.public_key_size
+            if public_key_size < 10000:
+                score_factors.append("compact_keys")
+            
+            reason = f"Security Level {params.security_level.value}, {params.family.value}, " + ", ".join(score_factors)
+            rows.append((
+                status_ranks.get(params.standardization_status, 2), name,
+                params.security_level.value, params.family, params.standardization_status,
+                public_key_size, params.signature_size, reason
+            ))
+        
+        # Sort by preference (NIST standards first, then candidates, then alternatives),
+        # so filtering the rows keeps them in recommendation order. Rows lead with
+        # (rank, name) and names are unique, so plain tuple comparison never looks further.
+        rows.sort()
+        self._recommendation_rows = rows
+    
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _build_algorithm_table() -> Dict[str, AlgorithmParameters]:
+        """Build the registry table for all supported algorithms"""
+        algorithms = {}
         
         # NTRU variants
         ntru_variants = ["hps2048509", "hps2048677", "hps4096821", "hrss701"]
         for variant in ntru_variants:
             ntru_impl = ExtendedNTRUImplementation(variant)
-            self.algorithms[f"NTRU-{variant}"] = AlgorithmParameters(
+            algorithms[f"NTRU-{variant}"] = AlgorithmParameters(
                 name=f"NTRU-{variant}",
                 family=PQAlgorithmFamily.LATTICE_BASED,
                 security_level=ntru_impl.params["security_level"],
@@ -539,7 +746,7 @@ class ExtendedAlgorithmRegistry:
         ]
         for variant in sphincs_variants:
             sphincs_impl = SPHINCSPlusImplementation(variant)
-            self.algorithms[f"SPHINCS+-{variant}"] = AlgorithmParameters(
+            algorithms[f"SPHINCS+-{variant}"] = AlgorithmParameters(
                 name=f"SPHINCS+-{variant}",
                 family=PQAlgorithmFamily.HASH_BASED,
                 security_level=sphincs_impl.params["security_level"],
@@ -562,7 +769,7 @@ class ExtendedAlgorithmRegistry:
         frodo_variants = ["FrodoKEM-640-AES", "FrodoKEM-976-AES", "FrodoKEM-1344-AES"]
         for variant in frodo_variants:
             frodo_impl = FrodoKEMImplementation(variant)
-            self.algorithms[variant] = AlgorithmParameters(
+            algorithms[variant] = AlgorithmParameters(
                 name=variant,
                 family=PQAlgorithmFamily.LATTICE_BASED,
                 security_level=frodo_impl.params["security_level"],
@@ -585,7 +792,7 @@ class ExtendedAlgorithmRegistry:
         mceliece_variants = ["mceliece348864", "mceliece460896", "mceliece6688128"]
         for variant in mceliece_variants:
             mceliece_impl = McElieceImplementation(variant)
-            self.algorithms[f"Classic-McEliece-{variant}"] = AlgorithmParameters(
+            algorithms[f"Classic-McEliece-{variant}"] = AlgorithmParameters(
                 name=f"Classic-McEliece-{variant}",
                 family=PQAlgorithmFamily.CODE_BASED,
                 security_level=mceliece_impl.params["security_level"],
@@ -608,7 +815,7 @@ class ExtendedAlgorithmRegistry:
         gemss_variants = ["gemss-128", "gemss-192", "gemss-256"]
         for variant in gemss_variants:
             gemss_impl = GeMSSImplementation(variant)
-            self.algorithms[f"GeMSS-{variant}"] = AlgorithmParameters(
+            algorithms[f"GeMSS-{variant}"] = AlgorithmParameters(
                 name=f"GeMSS-{variant}",
                 family=PQAlgorithmFamily.MULTIVARIATE,
                 security_level=gemss_impl.params["security_level"],
@@ -626,6 +833,8 @@ class ExtendedAlgorithmRegistry:
                 standardization_status="Alternative",
                 implementation_notes="Multivariate signature with small signatures but large public keys"
             )
+        
+        return algorithms
     
     def get_algorithm(self, name: str) -> Optional[AlgorithmParameters]:
         """Get algorithm parameters by name"""
@@ -633,23 +842,19 @@ class ExtendedAlgorithmRegistry:
     
     def list_algorithms_by_family(self, family: PQAlgorithmFamily) -> List[str]:
         """List all algorithms in a given family"""
-        return [name for name, params in self.algorithms.items() 
-                if params.family == family]
+        return list(self._by_family.get(family, ()))
     
     def list_algorithms_by_security_level(self, level: SecurityLevel) -> List[str]:
         """List all algorithms at a given security level"""
-        return [name for name, params in self.algorithms.items() 
-                if params.security_level == level]
+        return list(self._by_level.get(level, ()))
     
     def get_nist_standards(self) -> List[str]:
         """Get list of NIST standardized algorithms"""
-        return [name for name, params in self.algorithms.items() 
-                if params.standardization_status == "NIST_Standard"]
+        return list(self._by_status.get("NIST_Standard", ()))
     
     def get_nist_candidates(self) -> List[str]:
         """Get list of NIST candidate algorithms"""
-        return [name for name, params in self.algorithms.items() 
-                if params.standardization_status == "NIST_Candidate"]
+        return list(self._by_status.get("NIST_Candidate", ()))
     
     def generate_algorithm_comparison(self) -> Dict[str, Any]:
         """Generate comprehensive algorithm comparison"""
@@ -670,10 +875,10 @@ class ExtendedAlgorithmRegistry:
             comparison["by_security_level"][level.value] = self.list_algorithms_by_security_level(level)
         
         # Group by standardization status
-        standardization_groups = {"NIST_Standard": [], "NIST_Candidate": [], "Alternative": []}
-        for name, params in self.algorithms.items():
-            standardization_groups[params.standardization_status].append(name)
-        comparison["by_standardization"] = standardization_groups
+        comparison["by_standardization"] = {
+            status: list(self._by_status.get(status, ()))
+            for status in ("NIST_Standard", "NIST_Candidate", "Alternative")
+        }
         
         # Key size analysis
         key_sizes = {}
@@ -691,83 +896,72 @@ class ExtendedAlgorithmRegistry:
     
     def recommend_algorithms(self, requirements: Dict[str, Any]) -> List[Tuple[str, str]]:
         """Recommend algorithms based on requirements"""
-        recommendations = []
+        # The registry doesn't change after __init__, so results are memoized per requirements
+        try:
+            cache_key = frozenset(
+                (key, frozenset(value) if isinstance(value, (list, tuple, set, frozenset)) else value)
+                for key, value in requirements.items()
+            )
+        except TypeError:
+            return self._find_recommendations(requirements)
         
+        recommendations = self._recommendation_cache.get(cache_key)
+        if recommendations is None:
+            recommendations = self._find_recommendations(requirements)
+            self._recommendation_cache[cache_key] = recommendations
+        return list(recommendations)
+    
+    def _find_recommendations(self, requirements: Dict[str, Any]) -> List[Tuple[str, str]]:
+        """Filter the precomputed recommendation rows against the requirements"""
         required_security = requirements.get("security_level", SecurityLevel.LEVEL_1)
         max_key_size = requirements.get("max_public_key_size", float('inf'))
         max_signature_size = requirements.get("max_signature_size", float('inf'))
-        preferred_families = requirements.get("preferred_families", list(PQAlgorithmFamily))
+        preferred_families = requirements.get("preferred_families", _ALL_FAMILIES)
         standardization_preference = requirements.get("standardization_preference", "any")
         
-        for name, params in self.algorithms.items():
-            # Check security level
-            if params.security_level.value < required_security.value:
-                continue
-            
-            # Check family preference
-            if params.family not in preferred_families:
-                continue
-            
-            # Check standardization preference
-            if standardization_preference != "any" and params.standardization_status != standardization_preference:
-                continue
-            
-            # Check key size constraints
-            if params.key_sizes.get("public_key", 0) > max_key_size:
-                continue
-            
-            if params.key_sizes.get("signature", 0) > max_signature_size:
-                continue
-            
-            # Calculate recommendation score
-            score_factors = []
-            
-            # Prefer NIST standards
-            if params.standardization_status == "NIST_Standard":
-                score_factors.append("NIST_Standard")
-            elif params.standardization_status == "NIST_Candidate":
-                score_factors.append("NIST_Candidate")
-            
-            # Consider performance characteristics
-            perf = params.performance_characteristics
-            if perf.get("key_generation") == "fast":
-                score_factors.append("fast_keygen")
-            if perf.get("signing") == "fast" or perf.get("encapsulation") == "fast":
-                score_factors.append("fast_crypto_ops")
-            
-            # Prefer smaller key sizes
-            public_key_size = params.key_sizes.get("public_key", 0)
-            if public_key_size < 10000:
-                score_factors.append("compact_keys")
-            
-            reason = f"Security Level {params.security_level.value}, {params.family.value}, " + ", ".join(score_factors)
-            recommendations.append((name, reason))
-        
-        # Sort by preference (NIST standards first, then candidates, then alternatives)
-        def sort_key(item):
-            name, reason = item
-            params = self.algorithms[name]
-            if params.standardization_status == "NIST_Standard":
-                return (0, name)
-            elif params.standardization_status == "NIST_Candidate":
-                return (1, name)
-            else:
-                return (2, name)
-        
-        recommendations.sort(key=sort_key)
-        return recommendations
+        # Rows are precomputed in recommendation order, so filtering is all that's left
+        required_level = required_security.value
+        return [
+            (name, reason)
+            for _, name, level, family, status, public_key_size, signature_size, reason
+            in self._recommendation_rows
+            if level >= required_level
+            and family in preferred_families
+            and (standardization_preference == "any" or status == standardization_preference)
+            and public_key_size <= max_key_size
+            and signature_size <= max_signature_size
+        ]
+
+def _summarize_timings(operation: str, times: np.ndarray) -> Dict[str, float]:
+    """Summarize per-iteration timings (nanoseconds) as millisecond statistics"""
+    mean = float(times.mean())
+    return {
+        f"{operation}_avg_ms": mean / 1e6,
+        f"{operation}_median_ms": float(np.median(times)) / 1e6,
+        f"{operation}_p95_ms": float(np.percentile(times, 95)) / 1e6,
+        f"{operation}_cov": float(times.std()) / mean if mean else 0.0
+    }
 
 class AlgorithmBenchmarkSuite:
     """Benchmark suite for extended post-quantum algorithms"""
     
-    def __init__(self):
-        self.registry = ExtendedAlgorithmRegistry()
+    def __init__(self, registry: Optional[ExtendedAlgorithmRegistry] = None):
+        self.registry = registry or ExtendedAlgorithmRegistry()
         self.benchmark_results = {}
+        self._print_lock = threading.Lock()
     
-    def benchmark_kem_algorithms(self, iterations: int = 100) -> Dict[str, Dict[str, float]]:
-        """Benchmark KEM algorithms"""
+    def _log(self, message: str):
+        """Print progress output from benchmark worker threads one line at a time"""
+        with self._print_lock:
+            print(message)
+    
+    def benchmark_kem_algorithms(self, iterations: int = 100,
+                                 max_workers: int = 1) -> Dict[str, Dict[str, float]]:
+        """Benchmark KEM algorithms one after another, or on max_workers threads when it is above 1
+        
+        Concurrent runs share the CPU and the GIL, so their timings include each other's load.
+        """
         print("Benchmarking KEM Algorithms...")
-        results = {}
         
         kem_algorithms = [
             ("NTRU-hps2048509", ExtendedNTRUImplementation("hps2048509")),
@@ -776,45 +970,71 @@ class AlgorithmBenchmarkSuite:
             ("Classic-McEliece-348864", McElieceImplementation("mceliece348864"))
         ]
         
-        for name, implementation in kem_algorithms:
-            print(f"  Testing {name}...")
-            
-            # Key generation benchmark
-            keygen_times = []
-            for _ in range(iterations):
-                start_time = time.perf_counter()
-                public_key, private_key = implementation.generate_keypair()
-                keygen_times.append(time.perf_counter() - start_time)
-            
-            # Encapsulation benchmark
-            encap_times = []
-            for _ in range(iterations):
-                start_time = time.perf_counter()
-                ciphertext, shared_secret = implementation.encapsulate(public_key)
-                encap_times.append(time.perf_counter() - start_time)
-            
-            # Decapsulation benchmark
-            decap_times = []
-            for _ in range(iterations):
-                start_time = time.perf_counter()
-                recovered_secret = implementation.decapsulate(ciphertext, private_key)
-                decap_times.append(time.perf_counter() - start_time)
-            
-            results[name] = {
-                "keygen_avg_ms": sum(keygen_times) / len(keygen_times) * 1000,
-                "encap_avg_ms": sum(encap_times) / len(encap_times) * 1000,
-                "decap_avg_ms": sum(decap_times) / len(decap_times) * 1000,
-                "public_key_size": len(public_key),
-                "private_key_size": len(private_key),
-                "ciphertext_size": len(ciphertext)
-            }
-        
-        return results
+        if max_workers <= 1:
+            return {name: self._benchmark_kem(name, implementation, iterations)
+                    for name, implementation in kem_algorithms}
+        
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(self._benchmark_kem, name, implementation, iterations)
+                       for name, implementation in kem_algorithms]
+            # Collect in submission order so reports list algorithms consistently
+            return {name: future.result() for (name, _), future in zip(kem_algorithms, futures)}
+    
+    def _benchmark_keygen(self, implementation: Any,
+                          iterations: int) -> Tuple[np.ndarray, Tuple[bytes, bytes]]:
+        """Time key generation one call per sample, the same way for every algorithm"""
+        # Timed operations are bound to locals so attribute lookups stay outside the timed region
+        clock = time.perf_counter_ns
+        generate_keypair = implementation.generate_keypair
+        keygen_times = np.empty(iterations)
+        for i in range(iterations):
+            start_ns = clock()
+            keypair = generate_keypair()
+            keygen_times[i] = clock() - start_ns
+        return keygen_times, keypair
+    
+    def _benchmark_kem(self, name: str, implementation: Any, iterations: int) -> Dict[str, float]:
+        """Benchmark key generation, encapsulation and decapsulation for one KEM"""
+        self._log(f"  Testing {name}...")
+        clock = time.perf_counter_ns
+        
+        # Warm up allocator and code paths so first-call costs stay out of the samples
+        for _ in range(min(5, iterations // 10 + 1)):
+            public_key, private_key = implementation.generate_keypair()
+            ciphertext, shared_secret = implementation.encapsulate(public_key)
+            implementation.decapsulate(ciphertext, private_key)
+        
+        # Key generation benchmark
+        keygen_times, (public_key, private_key) = self._benchmark_keygen(implementation, iterations)
+        
+        # Encapsulation benchmark
+        encapsulate = implementation.encapsulate
+        encap_times = np.empty(iterations)
+        for i in range(iterations):
+            start_ns = clock()
+            ciphertext, shared_secret = encapsulate(public_key)
+            encap_times[i] = clock() - start_ns
+        
+        # Decapsulation benchmark
+        decapsulate = implementation.decapsulate
+        decap_times = np.empty(iterations)
+        for i in range(iterations):
+            start_ns = clock()
+            recovered_secret = decapsulate(ciphertext, private_key)
+            decap_times[i] = clock() - start_ns
+        
+        return {
+            **_summarize_timings("keygen", keygen_times),
+            **_summarize_timings("encap", encap_times),
+            **_summarize_timings("decap", decap_times),
+            "public_key_size": len(public_key),
+            "private_key_size": len(private_key),
+            "ciphertext_size": len(ciphertext)
+        }
     
     def benchmark_signature_algorithms(self, iterations: int = 100) -> Dict[str, Dict[str, float]]:
-        """Benchmark signature algorithms"""
+        """Benchmark signature algorithms one after another so their timings don't compete"""
         print("Benchmarking Signature Algorithms...")
-        results = {}
         
         test_message = b"This is a test message for benchmarking post-quantum signature algorithms"
         
@@ -824,41 +1044,49 @@ class AlgorithmBenchmarkSuite:
             ("GeMSS-128", GeMSSImplementation("gemss-128")),
         ]
         
-        for name, implementation in signature_algorithms:
-            print(f"  Testing {name}...")
-            
-            # Key generation benchmark
-            keygen_times = []
-            for _ in range(iterations):
-                start_time = time.perf_counter()
-                public_key, private_key = implementation.generate_keypair()
-                keygen_times.append(time.perf_counter() - start_time)
-            
-            # Signing benchmark
-            sign_times = []
-            for _ in range(iterations):
-                start_time = time.perf_counter()
-                signature = implementation.sign(test_message, private_key)
-                sign_times.append(time.perf_counter() - start_time)
-            
-            # Verification benchmark
-            verify_times = []
-            for _ in range(iterations):
-                start_time = time.perf_counter()
-                is_valid = implementation.verify(test_message, signature, public_key)
-                verify_times.append(time.perf_counter() - start_time)
-            
-            results[name] = {
-                "keygen_avg_ms": sum(keygen_times) / len(keygen_times) * 1000,
-                "sign_avg_ms": sum(sign_times) / len(sign_times) * 1000,
-                "verify_avg_ms": sum(verify_times) / len(verify_times) * 1000,
-                "public_key_size": len(public_key),
-                "private_key_size": len(private_key),
-                "signature_size": len(signature),
-                "verification_success": is_valid
-            }
-        
-        return results
+        return {name: self._benchmark_signature(name, implementation, test_message, iterations)
+                for name, implementation in signature_algorithms}
+    
+    def _benchmark_signature(self, name: str, implementation: Any, test_message: bytes,
+                             iterations: int) -> Dict[str, Any]:
+        """Benchmark key generation, signing and verification for one signature scheme"""
+        self._log(f"  Testing {name}...")
+        clock = time.perf_counter_ns
+        
+        # Warm up allocator and code paths so first-call costs stay out of the samples
+        for _ in range(min(5, iterations // 10 + 1)):
+            public_key, private_key = implementation.generate_keypair()
+            signature = implementation.sign(test_message, private_key)
+            implementation.verify(test_message, signature, public_key)
+        
+        # Key generation benchmark
+        keygen_times, (public_key, private_key) = self._benchmark_keygen(implementation, iterations)
+        
+        # Signing benchmark
+        sign = implementation.sign
+        sign_times = np.empty(iterations)
+        for i in range(iterations):
+            start_ns = clock()
+            signature = sign(test_message, private_key)
+            sign_times[i] = clock() - start_ns
+        
+        # Verification benchmark
+        verify = implementation.verify
+        verify_times = np.empty(iterations)
+        for i in range(iterations):
+            start_ns = clock()
+            is_valid = verify(test_message, signature, public_key)
+            verify_times[i] = clock() - start_ns
+        
+        return {
+            **_summarize_timings("keygen", keygen_times),
+            **_summarize_timings("sign", sign_times),
+            **_summarize_timings("verify", verify_times),
+            "public_key_size": len(public_key),
+            "private_key_size": len(private_key),
+            "signature_size": len(signature),
+            "verification_success": is_valid
+        }
     
     def generate_benchmark_report(self, output_file: str = "extended_pq_benchmark.json"):
         """Generate comprehensive benchmark report"""
@@ -881,8 +1109,15 @@ class AlgorithmBenchmarkSuite:
             "recommendations": self._generate_algorithm_recommendations()
         }
         
-        with open(output_file, 'w') as f:
-            json.dump(report, f, indent=2, default=str)
+        if ORJSON_AVAILABLE:
+            with open(output_file, 'wb') as f:
+                f.write(orjson.dumps(
+                    report, default=str,
+                    option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+                ))
+        else:
+            with open(output_file, 'w') as f:
+                json.dump(report, f, indent=2, default=str)
         
         print(f"Benchmark report saved to: {output_file}")
         return report
@@ -900,26 +1135,36 @@ class AlgorithmBenchmarkSuite:
         
         # Find fastest KEM operations
         if kem_results:
-            fastest_keygen = min(kem_results.items(), key=lambda x: x[1]["keygen_avg_ms"])
-            fastest_encap = min(kem_results.items(), key=lambda x: x[1]["encap_avg_ms"])
-            smallest_keys = min(kem_results.items(), key=lambda x: x[1]["public_key_size"])
-            
-            summary["fastest_kem_keygen"] = {"algorithm": fastest_keygen[0], "time_ms": fastest_keygen[1]["keygen_avg_ms"]}
-            summary["fastest_kem_encap"] = {"algorithm": fastest_encap[0], "time_ms": fastest_encap[1]["encap_avg_ms"]}
-            summary["smallest_kem_keys"] = {"algorithm": smallest_keys[0], "size_bytes": smallest_keys[1]["public_key_size"]}
+            fastest_keygen, fastest_encap, smallest_keys = self._find_minimums(
+                kem_results, ("keygen_median_ms", "encap_median_ms", "public_key_size")
+            )
+            summary["fastest_kem_keygen"] = {"algorithm": fastest_keygen[0], "time_ms": fastest_keygen[1]}
+            summary["fastest_kem_encap"] = {"algorithm": fastest_encap[0], "time_ms": fastest_encap[1]}
+            summary["smallest_kem_keys"] = {"algorithm": smallest_keys[0], "size_bytes": smallest_keys[1]}
         
         # Find fastest signature operations
         if signature_results:
-            fastest_keygen = min(signature_results.items(), key=lambda x: x[1]["keygen_avg_ms"])
-            fastest_sign = min(signature_results.items(), key=lambda x: x[1]["sign_avg_ms"])
-            smallest_sigs = min(signature_results.items(), key=lambda x: x[1]["signature_size"])
-            
-            summary["fastest_signature_keygen"] = {"algorithm": fastest_keygen[0], "time_ms": fastest_keygen[1]["keygen_avg_ms"]}
-            summary["fastest_signing"] = {"algorithm": fastest_sign[0], "time_ms": fastest_sign[1]["sign_avg_ms"]}
-            summary["smallest_signatures"] = {"algorithm": smallest_sigs[0], "size_bytes": smallest_sigs[1]["signature_size"]}
+            fastest_keygen, fastest_sign, smallest_sigs = self._find_minimums(
+                signature_results, ("keygen_median_ms", "sign_median_ms", "signature_size")
+            )
+            summary["fastest_signature_keygen"] = {"algorithm": fastest_keygen[0], "time_ms": fastest_keygen[1]}
+            summary["fastest_signing"] = {"algorithm": fastest_sign[0], "time_ms": fastest_sign[1]}
+            summary["smallest_signatures"] = {"algorithm": smallest_sigs[0], "size_bytes": smallest_sigs[1]}
         
         return summary
     
+    @staticmethod
+    def _find_minimums(results: Dict[str, Dict[str, Any]], metrics: Tuple[str, ...]) -> List[List[Any]]:
+        """Find the (algorithm, value) minimizing each metric in a single pass over the results"""
+        best = [[None, float('inf')] for _ in metrics]
+        for name, result in results.items():
+            for entry, metric in zip(best, metrics):
+                value = result[metric]
+                if value < entry[1]:
+                    entry[0] = name
+                    entry[1] = value
+        return best
+    
     def _generate_algorithm_recommendations(self) -> Dict[str, List[str]]:
         """Generate algorithm recommendations for different use cases"""
         recommendations = {}
@@ -961,7 +1206,7 @@ if __name__ == "__main__":
     
     # Initialize registry and benchmark suite
     registry = ExtendedAlgorithmRegistry()
-    benchmark_suite = AlgorithmBenchmarkSuite()
+    benchmark_suite = AlgorithmBenchmarkSuite(registry=registry)
     
     # Demo 1: Algorithm Registry Overview
     print("1. Algorithm Registry Overview")
@@ -996,8 +1241,10 @@ if __name__ == "__main__":
     print("\n\n3. Key Size Analysis")
     print("-" * 50)
     
-    print(f"{'Algorithm':<30} {'Public Key':<12} {'Private Key':<12} {'Signature/CT':<12}")
-    print("-" * 70)
+    lines = [
+        f"{'Algorithm':<30} {'Public Key':<12} {'Private Key':<12} {'Signature/CT':<12}",
+        "-" * 70
+    ]
     
     sample_algorithms = [
         "NTRU-hps2048509",
@@ -1010,11 +1257,14 @@ if __name__ == "__main__":
     for alg_name in sample_algorithms:
         if alg_name in registry.algorithms:
             params = registry.get_algorithm(alg_name)
-            pub_size = params.key_sizes.get("public_key", 0)
-            priv_size = params.key_sizes.get("private_key", 0)
-            sig_size = params.key_sizes.get("signature", params.key_sizes.get("ciphertext", 0))
+            pub_size = params.public_key_size
+            priv_size = params.private_key_size
+            sig_size = params.signature_size or params.ciphertext_size
             
-            print(f"{alg_name:<30} {pub_size:<12} {priv_size:<12} {sig_size:<12}")
+            lines.append(f"{alg_name:<30} {pub_size:<12} {priv_size:<12} {sig_size:<12}")
+    
+    # Emit the whole table with a single write
+    sys.stdout.write("\n".join(lines) + "\n")
     
     # Demo 4: Algorithm Recommendations
     print("\n\n4. Algorithm Recommendations")
@@ -1055,45 +1305,47 @@ if __name__ == "__main__":
             print(f"     Reason: {reason}")
     
     # Demo 5: Performance Benchmarking (Sample)
-    print("\n\n5. Performance Benchmarking Sample")
-    print("-" * 50)
-    
-    print("Running sample benchmarks...")
-    
-    # Quick NTRU benchmark
-    ntru = ExtendedNTRUImplementation("hps2048509")
-    
-    start_time = time.perf_counter()
-    pub_key, priv_key = ntru.generate_keypair()
-    keygen_time = time.perf_counter() - start_time
-    
-    start_time = time.perf_counter()
-    ciphertext, secret = ntru.encapsulate(pub_key)
-    encap_time = time.perf_counter() - start_time
-    
-    print(f"\nNTRU-HPS-2048-509 Sample Results:")
-    print(f"  Key Generation: {keygen_time*1000:.2f} ms")
-    print(f"  Encapsulation:  {encap_time*1000:.2f} ms")
-    print(f"  Public Key:     {len(pub_key)} bytes")
-    print(f"  Ciphertext:     {len(ciphertext)} bytes")
-    
-    # Quick SPHINCS+ benchmark
-    sphincs = SPHINCSPlusImplementation("sphincs-sha256-128f-robust")
-    
-    start_time = time.perf_counter()
-    pub_key, priv_key = sphincs.generate_keypair()
-    keygen_time = time.perf_counter() - start_time
-    
-    test_msg = b"Test message for SPHINCS+"
-    start_time = time.perf_counter()
-    signature = sphincs.sign(test_msg, priv_key)
-    sign_time = time.perf_counter() - start_time
-    
-    print(f"\nSPHINCS+-SHA256-128f Sample Results:")
-    print(f"  Key Generation: {keygen_time*1000:.2f} ms")
-    print(f"  Signing:        {sign_time*1000:.2f} ms")
-    print(f"  Public Key:     {len(pub_key)} bytes")
-    print(f"  Signature:      {len(signature)} bytes")
+    # Set PQ_DEMO_SAMPLES=0 to skip the sample key generation and signing runs
+    if os.environ.get("PQ_DEMO_SAMPLES", "1") == "1":
+        print("\n\n5. Performance Benchmarking Sample")
+        print("-" * 50)
+        
+        print("Running sample benchmarks...")
+        
+        # Quick NTRU benchmark
+        ntru = ExtendedNTRUImplementation("hps2048509")
+        
+        start_ns = time.perf_counter_ns()
+        pub_key, priv_key = ntru.generate_keypair()
+        keygen_time = time.perf_counter_ns() - start_ns
+        
+        start_ns = time.perf_counter_ns()
+        ciphertext, secret = ntru.encapsulate(pub_key)
+        encap_time = time.perf_counter_ns() - start_ns
+        
+        print(f"\nNTRU-HPS-2048-509 Sample Results:")
+        print(f"  Key Generation: {keygen_time / 1e6:.2f} ms")
+        print(f"  Encapsulation:  {encap_time / 1e6:.2f} ms")
+        print(f"  Public Key:     {len(pub_key)} bytes")
+        print(f"  Ciphertext:     {len(ciphertext)} bytes")
+        
+        # Quick SPHINCS+ benchmark
+        sphincs = SPHINCSPlusImplementation("sphincs-sha256-128f-robust")
+        
+        start_ns = time.perf_counter_ns()
+        pub_key, priv_key = sphincs.generate_keypair()
+        keygen_time = time.perf_counter_ns() - start_ns
+        
+        test_msg = b"Test message for SPHINCS+"
+        start_ns = time.perf_counter_ns()
+        signature = sphincs.sign(test_msg, priv_key)
+        sign_time = time.perf_counter_ns() - start_ns
+        
+        print(f"\nSPHINCS+-SHA256-128f Sample Results:")
+        print(f"  Key Generation: {keygen_time / 1e6:.2f} ms")
+        print(f"  Signing:        {sign_time / 1e6:.2f} ms")
+        print(f"  Public Key:     {len(pub_key)} bytes")
+        print(f"  Signature:      {len(signature)} bytes")
     
     # Demo 6: Algorithm Comparison Report
     print("\n\n6. Generating Algorithm Comparison")
@@ -22,20 +22,111 @@ import threading
 import time
 import json
 from datetime import datetime
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Iterator
 import webbrowser
-from dataclasses import asdict
+from itertools import islice
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from multiprocessing import get_context
+from dataclasses import asdict, is_dataclass
 
-# Import the core suite modules
+# Import the core suite modules; the full suite (and its plotting dependencies)
+# is loaded in the background once the window is up
 try:
-    from main import QuantumSafeCryptoSuite
     from hybrid_tls import CryptoAlgorithm, KeyExchangeType
     from quantum_signatures import SignatureAlgorithm
-    from performance_benchmark import CryptographicBenchmark
 except ImportError as e:
     messagebox.showerror("Import Error", f"Failed to import required modules: {e}")
     sys.exit(1)
 
+# Default cap on lines kept in the log and results displays
+MAX_LOG_LINES = 2000
+
+# Lines inserted into the results display per Tk call
+RESULTS_CHUNK_LINES = 256
+
+# File buffer size for result exports
+EXPORT_BUFFER_SIZE = 1 << 20
+
+# Minimum seconds between progress display updates (20 Hz)
+PROGRESS_UPDATE_INTERVAL = 0.05
+
+# Map demo IDs to suite methods
+DEMO_METHODS = {
+    'tls': 'demo_hybrid_tls',
+    'signatures': 'demo_quantum_signatures',
+    'client_server': 'demo_client_server',
+    'benchmark': 'demo_performance_benchmark',
+    'qkd': 'demo_qkd_simulation',
+    'migration': 'demo_migration_strategy',
+    'extended': 'demo_extended_algorithms',
+    'all': 'run_all_demos'
+}
+
+# Worker process for demonstrations, created on first use
+_demo_pool: Optional[ProcessPoolExecutor] = None
+
+def _get_demo_pool() -> ProcessPoolExecutor:
+    """Return the demonstration worker pool, starting it if needed"""
+    global _demo_pool
+    if _demo_pool is None:
+        # Spawn rather than fork: the GUI process runs Tk and background threads
+        _demo_pool = ProcessPoolExecutor(max_workers=1, mp_context=get_context("spawn"))
+    return _demo_pool
+
+def _shutdown_demo_pool():
+    """Stop the demonstration worker pool, terminating any demonstration still running"""
+    global _demo_pool
+    if _demo_pool is None:
+        return
+    # Grab the workers first: shutdown() drops the pool's reference to them
+    processes = list((_demo_pool._processes or {}).values())
+    _demo_pool.shutdown(wait=False, cancel_futures=True)
+    for process in processes:
+        process.terminate()
+    _demo_pool = None
+
+def _run_demo(crypto_suite, demo_id: str, iterations: int):
+    """Run a demonstration on the given suite and return its result and duration"""
+    method = getattr(crypto_suite, DEMO_METHODS[demo_id])
+    kwargs = {'quick_mode': iterations < 50} if demo_id == 'benchmark' else {}
+    
+    start_time = time.time()
+    result = method(**kwargs)
+    return result, time.time() - start_time
+
+# Suite owned by the worker process, built by its first task
+_worker_suite = None
+
+def _get_worker_suite():
+    """Return the worker process's suite, importing and building it if needed"""
+    global _worker_suite
+    if _worker_suite is None:
+        from main import QuantumSafeCryptoSuite
+        _worker_suite = QuantumSafeCryptoSuite()
+    return _worker_suite
+
+def _warm_demo_worker():
+    """Load the suite in the worker process ahead of the first demonstration"""
+    _get_worker_suite()
+
+def _run_demo_in_process(demo_id: str, iterations: int):
+    """Run a demonstration inside the worker process"""
+    result, duration = _run_demo(_get_worker_suite(), demo_id, iterations)
+    try:
+        pickle.dumps(result)
+    except Exception:  # PicklingError, or TypeError/AttributeError for some objects
+        # Send back a text rendering rather than losing the finished run
+        result = str(result)
+    return result, duration
+
+def _json_default(obj):
+    """Convert result objects that json can't serialize natively"""
+    if is_dataclass(obj) and not isinstance(obj, type):
+        return asdict(obj)
+    return str(obj)
+
 class QuantumSafeGUI:
     """Main GUI application class"""
     
@@ -45,13 +136,26 @@ class QuantumSafeGUI:
         self.root.geometry("1200x800")
         self.root.minsize(1000, 700)
         
-        # Initialize the crypto suite
-        self.crypto_suite = QuantumSafeCryptoSuite()
+        # Demonstrations run in the worker process, which loads its own suite;
+        # the GUI only builds one if it has to fall back to a thread
+        self.crypto_suite = None
+        self.suite_ready = False
         
         # GUI state
         self.current_demo = None
         self.demo_results = {}
         self.is_running_demo = False
+        self.displayed_demo = None
+        
+        # Log lines queued by worker threads until the next batched insert
+        self._log_buffer: List[str] = []
+        self._log_flush_scheduled = False
+        self._log_lock = threading.Lock()
+        
+        # Latest progress message waiting for the next throttled update
+        self._pending_progress: Optional[str] = None
+        self._last_progress_time = 0.0
+        self._progress_lock = threading.Lock()
         
         # Create GUI theme
         self.setup_theme()
@@ -61,9 +165,53 @@ class QuantumSafeGUI:
         self.create_main_interface()
         self.create_status_bar()
         
+        # Load the suite in the worker process so the window appears immediately
+        self.start_button.config(state='disabled')
+        self.status_var.set("Initializing cryptography suite...")
+        try:
+            future = _get_demo_pool().submit(_warm_demo_worker)
+        except (OSError, RuntimeError) as e:
+            self._mark_suite_ready(f"Worker process unavailable ({e}), demonstrations will run in a thread")
+        else:
+            future.add_done_callback(lambda f: self._after_future(self._suite_ready, f))
+        
         # Bind window close event
         self.root.protocol("WM_DELETE_WINDOW", self.on_closing)
     
+    def _after_future(self, callback, *args):
+        """Hand a finished worker future back to the Tk thread"""
+        try:
+            self.root.after(0, callback, *args)
+        except (tk.TclError, RuntimeError):
+            pass  # The window was closed while the worker was busy
+    
+    def _suite_ready(self, future):
+        """Handle the worker process finishing loading its crypto suite"""
+        try:
+            future.result()
+        except BrokenProcessPool as e:
+            # The thread fallback loads its own suite when a demonstration starts
+            self._mark_suite_ready(f"Worker process unavailable ({e}), demonstrations will run in a thread")
+        except (Exception, SystemExit) as e:  # main exits when its own imports fail
+            self._suite_failed(e)
+        else:
+            self._mark_suite_ready()
+    
+    def _mark_suite_ready(self, warning=None):
+        """Enable demonstrations"""
+        self.suite_ready = True
+        self.start_button.config(state='normal')
+        self.status_var.set("Ready")
+        if warning:
+            self.log_message("WARNING", warning)
+        else:
+            self.log_message("INFO", "Cryptography suite initialized")
+    
+    def _suite_failed(self, error):
+        """Report a failure to load the crypto suite and exit"""
+        messagebox.showerror("Initialization Error", f"Failed to initialize the cryptography suite: {error}")
+        self.root.destroy()
+    
     def setup_theme(self):
         """Configure the application theme and styling"""
         # Configure ttk style
@@ -281,7 +429,7 @@ class QuantumSafeGUI:
         # Results display area
         self.results_display = scrolledtext.ScrolledText(results_frame, 
                                                        font=('Consolas', 10),
-                                                       wrap=tk.WORD)
+                                                       wrap=tk.WORD, undo=False)
         self.results_display.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
         
         # Initial message
@@ -330,13 +478,24 @@ class QuantumSafeGUI:
         self.iterations_var = tk.IntVar(value=25)
         iter_scale = ttk.Scale(iter_frame, from_=10, to=200, variable=self.iterations_var, orient='horizontal')
         iter_scale.pack(fill=tk.X, pady=5)
-        ttk.Label(iter_frame, text="Current: 25 iterations", style='Info.TLabel').pack(anchor='w')
+        self._iter_label = ttk.Label(iter_frame, text="Current: 25 iterations", style='Info.TLabel')
+        self._iter_label.pack(anchor='w')
+        
+        # Update label when scale changes, at most once per PROGRESS_UPDATE_INTERVAL while dragging
+        self._last_iter_update = 0.0
+        self._iter_update_scheduled = False
+        
+        def refresh_iter_label():
+            self._iter_update_scheduled = False
+            self._last_iter_update = time.monotonic()
+            self._iter_label.configure(text=f"Current: {self.iterations_var.get()} iterations")
         
-        # Update label when scale changes
         def update_iter_label(*args):
-            iter_scale.pack_info()['after'] = ttk.Label(iter_frame, 
-                text=f"Current: {self.iterations_var.get()} iterations", 
-                style='Info.TLabel').pack(anchor='w')
+            if self._iter_update_scheduled:
+                return
+            self._iter_update_scheduled = True
+            delay = self._last_iter_update + PROGRESS_UPDATE_INTERVAL - time.monotonic()
+            self.root.after(max(0, int(delay * 1000)), refresh_iter_label)
         
         self.iterations_var.trace('w', update_iter_label)
         
@@ -355,6 +514,15 @@ class QuantumSafeGUI:
         self.verbose_output_var = tk.BooleanVar(value=False)
         ttk.Checkbutton(gui_frame, text="Verbose output", 
                        variable=self.verbose_output_var).pack(anchor='w', padx=10, pady=5)
+        
+        # Lower this on slow machines to keep the log and results views responsive
+        lines_frame = ttk.Frame(gui_frame)
+        lines_frame.pack(fill=tk.X, padx=10, pady=5)
+        
+        ttk.Label(lines_frame, text="Max display lines:").pack(side=tk.LEFT)
+        self.max_log_lines_var = tk.IntVar(value=MAX_LOG_LINES)
+        ttk.Spinbox(lines_frame, from_=100, to=50000, increment=100,
+                   textvariable=self.max_log_lines_var, width=8).pack(side=tk.LEFT, padx=5)
     
     def create_logs_tab(self):
         """Create the logs and console tab"""
@@ -381,7 +549,7 @@ class QuantumSafeGUI:
         # Log display
         self.log_display = scrolledtext.ScrolledText(logs_frame, 
                                                    font=('Consolas', 9),
-                                                   wrap=tk.WORD)
+                                                   wrap=tk.WORD, undo=False)
         self.log_display.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
         
         # Add initial log entry
@@ -435,70 +603,95 @@ class QuantumSafeGUI:
             messagebox.showwarning("Demo Running", "A demonstration is already running. Please wait for it to complete.")
             return
         
+        if not self.suite_ready:
+            messagebox.showinfo("Initializing", "The cryptography suite is still loading. Please try again in a moment.")
+            return
+        
         # Update UI state
         self.is_running_demo = True
         self.start_button.config(state='disabled')
         self.stop_button.config(state='normal')
         self.progress_bar.start(10)
         
+        if demo_id not in DEMO_METHODS:
+            self.update_progress(f"❌ Unknown demonstration: {demo_id}")
+            self.log_message("ERROR", f"Unknown demonstration: {demo_id}")
+            self._demo_finished()
+            return
+        
+        self.update_progress(f"Starting {demo_id} demonstration...")
+        self.log_message("INFO", f"Starting {demo_id} demonstration")
+        
+        # Demos are CPU-bound Python, so run them in a worker process to keep
+        # the GIL free for the Tk main loop
+        try:
+            future = _get_demo_pool().submit(_run_demo_in_process, demo_id, self.iterations_var.get())
+        except (OSError, RuntimeError, BrokenProcessPool) as e:
+            self._run_demo_in_thread(demo_id, e)
+            return
+        
+        future.add_done_callback(lambda f: self._after_future(self._demo_process_done, demo_id, f))
+    
+    def _demo_process_done(self, demo_id, future):
+        """Handle a demonstration finishing in the worker process"""
+        try:
+            result, duration = future.result()
+        except BrokenProcessPool as e:
+            self._run_demo_in_thread(demo_id, e)
+        except Exception as e:
+            self._demo_failed(demo_id, e)
+        else:
+            self._demo_completed(demo_id, result, duration)
+    
+    def _run_demo_in_thread(self, demo_id, reason):
+        """Fall back to running a demonstration on a thread when the worker process can't be used"""
+        _shutdown_demo_pool()
+        self.log_message("WARNING", f"Worker process unavailable ({reason}), running {demo_id} in a thread")
+        
         # Run in separate thread to prevent GUI freezing
-        demo_thread = threading.Thread(target=self._run_demo_thread, args=(demo_id,))
+        demo_thread = threading.Thread(target=self._run_demo_thread, args=(demo_id, self.iterations_var.get()))
         demo_thread.daemon = True
         demo_thread.start()
     
-    def _run_demo_thread(self, demo_id):
+    def _run_demo_thread(self, demo_id, iterations):
         """Run demonstration in a separate thread"""
         try:
-            self.update_progress(f"Starting {demo_id} demonstration...")
-            self.log_message("INFO", f"Starting {demo_id} demonstration")
-            
-            # Map demo IDs to suite methods
-            demo_methods = {
-                'tls': self.crypto_suite.demo_hybrid_tls,
-                'signatures': self.crypto_suite.demo_quantum_signatures,
-                'client_server': self.crypto_suite.demo_client_server,
-                'benchmark': lambda: self.crypto_suite.demo_performance_benchmark(
-                    quick_mode=(self.iterations_var.get() < 50)),
-                'qkd': self.crypto_suite.demo_qkd_simulation,
-                'migration': self.crypto_suite.demo_migration_strategy,
-                'extended': self.crypto_suite.demo_extended_algorithms,
-                'all': self.crypto_suite.run_all_demos
-            }
-            
-            if demo_id in demo_methods:
-                start_time = time.time()
-                result = demo_methods[demo_id]()
-                end_time = time.time()
-                
-                # Store results
-                self.demo_results[demo_id] = {
-                    'result': result,
-                    'timestamp': datetime.now(),
-                    'duration': end_time - start_time,
-                    'demo_type': demo_id
-                }
-                
-                self.update_progress(f"✅ {demo_id} demonstration completed successfully!")
-                self.log_message("INFO", f"{demo_id} demonstration completed in {end_time - start_time:.2f}s")
-                
-                # Update results combo
-                self.root.after(0, self.refresh_results_combo)
-                
-                # Show results
-                if demo_id != 'all':
-                    self.root.after(0, lambda: self.show_demo_results(demo_id))
-            else:
-                self.update_progress(f"❌ Unknown demonstration: {demo_id}")
-                self.log_message("ERROR", f"Unknown demonstration: {demo_id}")
-                
-        except Exception as e:
-            self.update_progress(f"❌ Error in {demo_id}: {str(e)}")
-            self.log_message("ERROR", f"Error in {demo_id}: {str(e)}")
-            messagebox.showerror("Demonstration Error", f"An error occurred during the {demo_id} demonstration:\n\n{str(e)}")
+            if self.crypto_suite is None:
+                from main import QuantumSafeCryptoSuite
+                self.crypto_suite = QuantumSafeCryptoSuite()
+            result, duration = _run_demo(self.crypto_suite, demo_id, iterations)
+        except (Exception, SystemExit) as e:  # main exits when its own imports fail
+            self.root.after(0, self._demo_failed, demo_id, e)
+        else:
+            self.root.after(0, self._demo_completed, demo_id, result, duration)
+    
+    def _demo_completed(self, demo_id, result, duration):
+        """Store and display the results of a finished demonstration"""
+        self.demo_results[demo_id] = {
+            'result': result,
+            'timestamp': datetime.now(),
+            'duration': duration,
+            'demo_type': demo_id
+        }
+        
+        self.update_progress(f"✅ {demo_id} demonstration completed successfully!")
+        self.log_message("INFO", f"{demo_id} demonstration completed in {duration:.2f}s")
+        
+        # Update results combo
+        self.refresh_results_combo()
         
-        finally:
-            # Reset UI state
-            self.root.after(0, self._demo_finished)
+        # Show results
+        if demo_id != 'all':
+            self.show_demo_results(demo_id)
+        
+        self._demo_finished()
+    
+    def _demo_failed(self, demo_id, error):
+        """Report an error raised by a demonstration"""
+        self.update_progress(f"❌ Error in {demo_id}: {str(error)}")
+        self.log_message("ERROR", f"Error in {demo_id}: {str(error)}")
+        self._demo_finished()
+        messagebox.showerror("Demonstration Error", f"An error occurred during the {demo_id} demonstration:\n\n{str(error)}")
     
     def _demo_finished(self):
         """Called when a demonstration finishes"""
@@ -514,23 +707,60 @@ class QuantumSafeGUI:
     
     def update_progress(self, message):
         """Update the progress display"""
-        def update():
-            self.progress_var.set(message)
-            self.status_var.set(message)
-        
-        self.root.after(0, update)
+        with self._progress_lock:
+            already_scheduled = self._pending_progress is not None
+            self._pending_progress = message
+            if already_scheduled:
+                return
+        
+        # Redraw at most every PROGRESS_UPDATE_INTERVAL; later messages replace the pending one
+        delay = self._last_progress_time + PROGRESS_UPDATE_INTERVAL - time.monotonic()
+        self.root.after(max(0, int(delay * 1000)), self._flush_progress)
+    
+    def _flush_progress(self):
+        """Show the most recent progress message"""
+        with self._progress_lock:
+            message, self._pending_progress = self._pending_progress, None
+            self._last_progress_time = time.monotonic()
+        
+        self.progress_var.set(message)
+        self.status_var.set(message)
     
     def log_message(self, level, message):
-        """Add a message to the log display"""
-        def add_log():
-            timestamp = datetime.now().strftime("%H:%M:%S")
-            log_entry = f"[{timestamp}] {level}: {message}\n"
-            
-            self.log_display.insert(tk.END, log_entry)
-            if self.auto_scroll_var.get():
-                self.log_display.see(tk.END)
+        """Queue a message for the log display"""
+        timestamp = datetime.now().strftime("%H:%M:%S")
+        log_entry = f"[{timestamp}] {level}: {message}\n"
         
-        self.root.after(0, add_log)
+        with self._log_lock:
+            self._log_buffer.append(log_entry)
+            if self._log_flush_scheduled:
+                return
+            self._log_flush_scheduled = True
+        
+        self.root.after(50, self._flush_log_buffer)
+    
+    def _flush_log_buffer(self):
+        """Write all queued log messages to the log display in one insert"""
+        with self._log_lock:
+            buffer, self._log_buffer = self._log_buffer, []
+            self._log_flush_scheduled = False
+        
+        self.log_display.insert(tk.END, "".join(buffer))
+        self._trim_display(self.log_display)
+        
+        if self.auto_scroll_var.get():
+            self.log_display.see(tk.END)
+    
+    def _trim_display(self, display):
+        """Drop the oldest lines of a text display beyond the configured maximum"""
+        try:
+            max_lines = max(1, self.max_log_lines_var.get())
+        except tk.TclError:  # Spinbox holds a non-integer while being edited
+            max_lines = MAX_LOG_LINES
+        
+        line_count = int(display.index('end-1c').split('.')[0])
+        if line_count > max_lines:
+            display.delete('1.0', f'{line_count - max_lines + 1}.0')
     
     def refresh_results_combo(self):
         """Refresh the results selection combo box"""
@@ -571,63 +801,72 @@ class QuantumSafeGUI:
         if demo_id and demo_id in self.demo_results:
             self.show_demo_results(demo_id)
     
-    def show_demo_results(self, demo_id):
-        """Display results for a specific demonstration"""
-        if demo_id not in self.demo_results:
-            return
-        
+    def _format_results_stream(self, demo_id) -> Iterator[str]:
+        """Yield the formatted result lines for a demonstration"""
         result_data = self.demo_results[demo_id]
         
-        # Clear current results
-        self.results_display.delete('1.0', tk.END)
-        
-        # Format and display results
-        output = []
-        output.append(f"=== {demo_id.upper()} DEMONSTRATION RESULTS ===")
-        output.append(f"Completed: {result_data['timestamp'].strftime('%Y-%m-%d %H:%M:%S')}")
-        output.append(f"Duration: {result_data['duration']:.2f} seconds")
-        output.append("=" * 50)
-        output.append("")
+        yield f"=== {demo_id.upper()} DEMONSTRATION RESULTS ==="
+        yield f"Completed: {result_data['timestamp'].strftime('%Y-%m-%d %H:%M:%S')}"
+        yield f"Duration: {result_data['duration']:.2f} seconds"
+        yield "=" * 50
+        yield ""
         
         # Format specific results based on demo type
         result = result_data['result']
         
         if demo_id == 'tls' and isinstance(result, list):
-            output.append("TLS HANDSHAKE RESULTS:")
-            output.append("-" * 30)
+            yield "TLS HANDSHAKE RESULTS:"
+            yield "-" * 30
             for name, res, duration in result:
-                output.append(f"Configuration: {name}")
-                output.append(f"  Duration: {duration:.3f}s")
-                output.append(f"  Algorithms: {', '.join(res['algorithms'])}")
-                output.append(f"  Key Size: {res['shared_secret_size']} bytes")
-                output.append(f"  Efficiency: {res['protocol_efficiency']*100:.1f}%")
-                output.append("")
+                yield f"Configuration: {name}"
+                yield f"  Duration: {duration:.3f}s"
+                yield f"  Algorithms: {', '.join(res['algorithms'])}"
+                yield f"  Key Size: {res['shared_secret_size']} bytes"
+                yield f"  Efficiency: {res['protocol_efficiency']*100:.1f}%"
+                yield ""
         
         elif demo_id == 'signatures' and isinstance(result, list):
-            output.append("DIGITAL SIGNATURE RESULTS:")
-            output.append("-" * 35)
-            output.append(f"{'Algorithm':<20} {'Sign(ms)':<10} {'Verify(ms)':<12} {'Sig Size':<10}")
-            output.append("-" * 55)
+            yield "DIGITAL SIGNATURE RESULTS:"
+            yield "-" * 35
+            yield f"{'Algorithm':<20} {'Sign(ms)':<10} {'Verify(ms)':<12} {'Sig Size':<10}"
+            yield "-" * 55
             for res in result:
-                output.append(f"{res['algorithm']:<20} {res['sign_ms']:<10.2f} {res['verify_ms']:<12.2f} {res['signature_size']:<10}")
+                yield f"{res['algorithm']:<20} {res['sign_ms']:<10.2f} {res['verify_ms']:<12.2f} {res['signature_size']:<10}"
         
         elif demo_id == 'benchmark' and isinstance(result, dict):
-            output.append("PERFORMANCE BENCHMARK RESULTS:")
-            output.append("-" * 40)
+            yield "PERFORMANCE BENCHMARK RESULTS:"
+            yield "-" * 40
             for category, results in result.items():
                 if results:
-                    output.append(f"\n{category.upper()} Results:")
+                    yield f"\n{category.upper()} Results:"
                     for res in results[:5]:  # Show top 5
-                        output.append(f"  {res.algorithm}: {res.mean:.2f}ms")
+                        yield f"  {res.algorithm}: {res.mean:.2f}ms"
         
         else:
             # Generic result formatting
-            output.append("DEMONSTRATION RESULTS:")
-            output.append("-" * 25)
-            output.append(str(result))
+            yield "DEMONSTRATION RESULTS:"
+            yield "-" * 25
+            yield str(result)
+    
+    def show_demo_results(self, demo_id):
+        """Display results for a specific demonstration"""
+        if demo_id not in self.demo_results:
+            return
         
-        # Insert results into display
-        self.results_display.insert(tk.END, "\n".join(output))
+        # Clear current results
+        self.results_display.delete('1.0', tk.END)
+        self.displayed_demo = demo_id
+        
+        # Insert results in chunks rather than building the whole text first
+        lines = self._format_results_stream(demo_id)
+        while True:
+            chunk = list(islice(lines, RESULTS_CHUNK_LINES))
+            if not chunk:
+                break
+            self.results_display.insert(tk.END, "\n".join(chunk) + "\n")
+            if len(chunk) == RESULTS_CHUNK_LINES:
+                self.root.update_idletasks()
+        self._trim_display(self.results_display)
         
         # Switch to results tab
         self.notebook.select(1)
@@ -641,7 +880,8 @@ class QuantumSafeGUI:
     
     def export_current_results(self):
         """Export the currently displayed results"""
-        if not self.results_display.get('1.0', tk.END).strip():
+        demo_id = self.displayed_demo
+        if demo_id not in self.demo_results:
             messagebox.showwarning("No Results", "No results to export.")
             return
         
@@ -653,8 +893,20 @@ class QuantumSafeGUI:
         
         if filename:
             try:
-                with open(filename, 'w') as f:
-                    f.write(self.results_display.get('1.0', tk.END))
+                with open(filename, 'w', buffering=EXPORT_BUFFER_SIZE) as f:
+                    if filename.endswith('.json'):
+                        # Serialize the result objects themselves rather than the display text
+                        data = self.demo_results[demo_id]
+                        json.dump({
+                            'demo_type': demo_id,
+                            'timestamp': data['timestamp'].isoformat(),
+                            'duration': data['duration'],
+                            'result': data['result']
+                        }, f, indent=2, default=_json_default)
+                    else:
+                        for line in self._format_results_stream(demo_id):
+                            f.write(line)
+                            f.write("\n")
                 messagebox.showinfo("Export Success", f"Results exported to {filename}")
                 self.log_message("INFO", f"Results exported to {filename}")
             except Exception as e:
@@ -725,6 +977,8 @@ class QuantumSafeGUI:
                     self.show_warnings_var.set(settings['show_warnings'])
                 if 'verbose_output' in settings:
                     self.verbose_output_var.set(settings['verbose_output'])
+                if 'max_display_lines' in settings:
+                    self.max_log_lines_var.set(settings['max_display_lines'])
                 
                 messagebox.showinfo("Import Success", "Settings imported successfully.")
                 self.log_message("INFO", f"Settings imported from {filename}")
@@ -749,6 +1003,7 @@ class QuantumSafeGUI:
                     'auto_scroll': self.auto_scroll_var.get(),
                     'show_warnings': self.show_warnings_var.get(),
                     'verbose_output': self.verbose_output_var.get(),
+                    'max_display_lines': self.max_log_lines_var.get(),
                     'export_timestamp': datetime.now().isoformat()
                 }
                 
@@ -837,10 +1092,11 @@ For educational and research purposes only.
     def on_closing(self):
         """Handle application closing"""
         if self.is_running_demo:
-            if messagebox.askokcancel("Quit", "A demonstration is running. Do you want to quit anyway?"):
-                self.root.destroy()
-        else:
-            self.root.destroy()
+            if not messagebox.askokcancel("Quit", "A demonstration is running. Do you want to quit anyway?"):
+                return
+        
+        _shutdown_demo_pool()
+        self.root.destroy()
     
     def run(self):
         """Start the GUI application"""
@@ -0,0 +1,20 @@
+"""
+Gunicorn configuration for the Quantum-Safe Cryptography Web Dashboard
+
+Usage: gunicorn -c gunicorn_conf.py app:app
+"""
+
+import os
+
+bind = os.environ.get('DASHBOARD_BIND', '0.0.0.0:5000')
+
+# Keypairs, signatures and jobs live in process memory (app_data), so a single
+# worker process must serve every request. Concurrency comes from threads for
+# HTTP handling and from the app's ProcessPoolExecutor for CPU-bound crypto.
+workers = 1
+worker_class = 'gthread'
+threads = int(os.environ.get('DASHBOARD_THREADS', (os.cpu_count() or 1) * 4))
+
+# Benchmarks run in the background and are polled, so requests stay short
+timeout = 120
+keepalive = 5
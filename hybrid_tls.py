@@ -7,6 +7,7 @@ import os
 import time
 import hashlib
 import secrets
+from functools import lru_cache
 from typing import Dict, List, Optional, Tuple, Any
 from enum import Enum
 from dataclasses import dataclass
@@ -24,6 +25,11 @@ except ImportError:
     OQS_AVAILABLE = False
     logging.warning("OQS not available, using simulation mode")
 
+@lru_cache(maxsize=None)
+def _oqs_enabled_kems() -> frozenset:
+    """KEM mechanisms compiled into the loaded liboqs"""
+    return frozenset(oqs.get_enabled_kem_mechanisms())
+
 class KeyExchangeType(Enum):
     """Types of key exchange mechanisms"""
     CLASSICAL = "classical"
@@ -85,10 +91,19 @@ class QuantumSafeKEM:
                 CryptoAlgorithm.SABER: "Saber-KEM",
                 CryptoAlgorithm.FIRESABER: "FireSaber-KEM"
             }
+            # FIPS 203 names; recent liboqs builds only ship Kyber under these
+            ml_kem_names = {
+                CryptoAlgorithm.KYBER512: "ML-KEM-512",
+                CryptoAlgorithm.KYBER768: "ML-KEM-768",
+                CryptoAlgorithm.KYBER1024: "ML-KEM-1024"
+            }
             
             if algorithm in oqs_names:
+                oqs_name = oqs_names[algorithm]
+                if oqs_name not in _oqs_enabled_kems() and ml_kem_names.get(algorithm) in _oqs_enabled_kems():
+                    oqs_name = ml_kem_names[algorithm]
                 try:
-                    self.kem = oqs.KeyEncapsulation(oqs_names[algorithm])
+                    self.kem = oqs.KeyEncapsulation(oqs_name)
                     self._use_simulation = False
                 except:
                     self._use_simulation = True
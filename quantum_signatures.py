@@ -13,6 +13,7 @@ from dataclasses import dataclass
 from datetime import datetime, timedelta
 import json
 import base64
+from functools import lru_cache
 
 from cryptography.hazmat.primitives import hashes, serialization
 from cryptography.hazmat.primitives.asymmetric import rsa, ec, ed25519, padding
@@ -29,6 +30,11 @@ except ImportError:
     OQS_AVAILABLE = False
     logging.warning("OQS not available, using simulation mode for PQ signatures")
 
+@lru_cache(maxsize=None)
+def _oqs_enabled_sigs() -> frozenset:
+    """Signature mechanisms compiled into the loaded liboqs"""
+    return frozenset(oqs.get_enabled_sig_mechanisms())
+
 class SignatureAlgorithm(Enum):
     """Supported signature algorithms"""
     # Classical
@@ -79,6 +85,13 @@ class QuantumSafeCertificate:
     serial_number: int
     certificate_der: bytes
 
+@dataclass
+class UnpackedPrivateKey:
+    """Private key parsed once so it can be reused across signatures"""
+    algorithm: SignatureAlgorithm
+    signer: Any
+    key: Any
+
 class QuantumSafeSignature:
     """Post-Quantum Signature Scheme wrapper"""
     
@@ -98,10 +111,19 @@ class QuantumSafeSignature:
                 SignatureAlgorithm.SPHINCS_SHA256_192F: "SPHINCS+-SHA256-192f-robust",
                 SignatureAlgorithm.SPHINCS_SHA256_256F: "SPHINCS+-SHA256-256f-robust"
             }
+            # FIPS 204 names; recent liboqs builds only ship Dilithium under these
+            ml_dsa_names = {
+                SignatureAlgorithm.DILITHIUM2: "ML-DSA-44",
+                SignatureAlgorithm.DILITHIUM3: "ML-DSA-65",
+                SignatureAlgorithm.DILITHIUM5: "ML-DSA-87"
+            }
             
             if algorithm in oqs_names:
+                oqs_name = oqs_names[algorithm]
+                if oqs_name not in _oqs_enabled_sigs() and ml_dsa_names.get(algorithm) in _oqs_enabled_sigs():
+                    oqs_name = ml_dsa_names[algorithm]
                 try:
-                    self.sig = oqs.Signature(oqs_names[algorithm])
+                    self.sig = oqs.Signature(oqs_name)
                     self._use_simulation = False
                 except:
                     self._use_simulation = True
@@ -147,6 +169,14 @@ class QuantumSafeSignature:
                 key_size_private=priv_size
             )
     
+    def unpack_private_key(self, private_key: bytes) -> bytes:
+        """Prepare a private key for repeated signing (raw bytes for PQ schemes)"""
+        return private_key
+    
+    def sign_unpacked(self, message: bytes, private_key: bytes) -> DigitalSignature:
+        """Sign a message using a key from unpack_private_key"""
+        return self.sign(message, private_key)
+    
     def sign(self, message: bytes, private_key: bytes) -> DigitalSignature:
         """Sign a message using the private key"""
         message_hash = hashlib.sha384(message).digest()
@@ -303,23 +333,28 @@ class ClassicalSignature:
         else:
             raise ValueError(f"Unsupported classical signature algorithm: {self.algorithm}")
     
+    def unpack_private_key(self, private_key_bytes: bytes):
+        """Parse a DER private key once for repeated signing"""
+        return serialization.load_der_private_key(private_key_bytes, None, self.backend)
+    
     def sign(self, message: bytes, private_key_bytes: bytes) -> DigitalSignature:
         """Sign a message using classical algorithms"""
+        return self.sign_unpacked(message, self.unpack_private_key(private_key_bytes))
+    
+    def sign_unpacked(self, message: bytes, private_key) -> DigitalSignature:
+        """Sign a message using a key from unpack_private_key"""
         message_hash = hashlib.sha384(message).digest()
         
         if self.algorithm in [SignatureAlgorithm.RSA_PSS_2048, SignatureAlgorithm.RSA_PSS_3072]:
-            private_key = serialization.load_der_private_key(private_key_bytes, None, self.backend)
             signature = private_key.sign(message, padding.PSS(
                 mgf=padding.MGF1(hashes.SHA384()),
                 salt_length=padding.PSS.MAX_LENGTH
             ), hashes.SHA384())
         
         elif self.algorithm in [SignatureAlgorithm.ECDSA_P256, SignatureAlgorithm.ECDSA_P384]:
-            private_key = serialization.load_der_private_key(private_key_bytes, None, self.backend)
             signature = private_key.sign(message, ec.ECDSA(hashes.SHA384()))
         
         elif self.algorithm == SignatureAlgorithm.ED25519:
-            private_key = serialization.load_der_private_key(private_key_bytes, None, self.backend)
             signature = private_key.sign(message)
         
         else:
@@ -483,6 +518,61 @@ class CertificateAuthority:
         self.logger.info(f"Revoked certificate with serial number: {serial_number}")
         return revocation_data
 
+def generate_subject_keypair(algorithm: SignatureAlgorithm) -> SignatureKeyPair:
+    """Generate a key pair outside any system instance (usable as a worker-pool task)"""
+    return HybridSignatureSystem._get_signer(algorithm).generate_keypair()
+
+def _benchmark_one(algorithm: SignatureAlgorithm, 
+                   test_message: bytes, 
+                   iterations: int) -> Dict[str, Any]:
+    """Benchmark a single algorithm"""
+    logger = logging.getLogger(__name__)
+    logger.info(f"Benchmarking {algorithm.value}...")
+    
+    try:
+        # One signer per algorithm, so the timed sections only cover
+        # the primitives and not backend context setup
+        signer = HybridSignatureSystem._get_signer(algorithm)
+        
+        # Key generation benchmark
+        keygen_times = []
+        sign_times = []
+        verify_times = []
+        
+        for i in range(iterations):
+            # Key generation
+            start_time = time.time()
+            keypair = signer.generate_keypair()
+            keygen_times.append(time.time() - start_time)
+            
+            # Signing
+            start_time = time.time()
+            signature_obj = signer.sign(test_message, keypair.private_key)
+            sign_times.append(time.time() - start_time)
+            
+            # Verification
+            start_time = time.time()
+            is_valid = signer.verify(
+                test_message, 
+                signature_obj.signature, 
+                keypair.public_key
+            )
+            verify_times.append(time.time() - start_time)
+        
+        return {
+            "keygen_avg_ms": sum(keygen_times) / len(keygen_times) * 1000,
+            "sign_avg_ms": sum(sign_times) / len(sign_times) * 1000,
+            "verify_avg_ms": sum(verify_times) / len(verify_times) * 1000,
+            "public_key_size": keypair.key_size_public,
+            "private_key_size": keypair.key_size_private,
+            "signature_size": signature_obj.signature_size,
+            "verification_success": is_valid
+        }
+        
+    except Exception as e:
+        logger.error(f"Benchmark failed for {algorithm.value}: {e}")
+        return {"error": str(e)}
+
 class HybridSignatureSystem:
     """Hybrid signature system supporting classical and post-quantum algorithms"""
     
@@ -492,26 +582,40 @@ class HybridSignatureSystem:
         self.certificates = {}  # Store issued certificates
         self.logger = logging.getLogger(__name__)
     
+    @staticmethod
+    def _get_signer(algorithm: SignatureAlgorithm):
+        """Create the signer implementation for an algorithm"""
+        if algorithm.value.startswith(("Dilithium", "Falcon", "SPHINCS")):
+            return QuantumSafeSignature(algorithm)
+        return ClassicalSignature(algorithm)
+    
     def create_keypair(self, algorithm: SignatureAlgorithm) -> SignatureKeyPair:
         """Create a key pair for any supported algorithm"""
-        if algorithm.value.startswith(("Dilithium", "Falcon", "SPHINCS")):
-            signer = QuantumSafeSignature(algorithm)
-        else:
-            signer = ClassicalSignature(algorithm)
-        
-        return signer.generate_keypair()
+        return self._get_signer(algorithm).generate_keypair()
     
     def sign_message(self, 
                     message: bytes, 
                     private_key: bytes, 
                     algorithm: SignatureAlgorithm) -> DigitalSignature:
         """Sign a message with specified algorithm"""
-        if algorithm.value.startswith(("Dilithium", "Falcon", "SPHINCS")):
-            signer = QuantumSafeSignature(algorithm)
-        else:
-            signer = ClassicalSignature(algorithm)
-        
-        return signer.sign(message, private_key)
+        return self._get_signer(algorithm).sign(message, private_key)
+    
+    def unpack_private_key(self, 
+                          private_key: bytes, 
+                          algorithm: SignatureAlgorithm) -> UnpackedPrivateKey:
+        """Parse a private key once for use with sign_with_unpacked"""
+        signer = self._get_signer(algorithm)
+        return UnpackedPrivateKey(
+            algorithm=algorithm,
+            signer=signer,
+            key=signer.unpack_private_key(private_key)
+        )
+    
+    def sign_with_unpacked(self, 
+                          message: bytes, 
+                          unpacked: UnpackedPrivateKey) -> DigitalSignature:
+        """Sign a message with a key from unpack_private_key"""
+        return unpacked.signer.sign_unpacked(message, unpacked.key)
     
     def verify_signature(self, 
                         message: bytes, 
@@ -519,12 +623,7 @@ class HybridSignatureSystem:
                         public_key: bytes, 
                         algorithm: SignatureAlgorithm) -> bool:
         """Verify a signature with specified algorithm"""
-        if algorithm.value.startswith(("Dilithium", "Falcon", "SPHINCS")):
-            signer = QuantumSafeSignature(algorithm)
-        else:
-            signer = ClassicalSignature(algorithm)
-        
-        return signer.verify(message, signature, public_key)
+        return self._get_signer(algorithm).verify(message, signature, public_key)
     
     def create_certificate_chain(self, 
                                 subject_name: str, 
@@ -534,6 +633,36 @@ class HybridSignatureSystem:
         # Generate subject key pair
         subject_keypair = self.create_keypair(algorithm)
         
+        return self._issue_certificate_chain(subject_name, algorithm, subject_keypair, validity_days)
+    
+    def create_certificate_chain_batch(self, 
+                                      subject_name: str, 
+                                      algorithm: SignatureAlgorithm,
+                                      count: int,
+                                      validity_days: int = 365,
+                                      executor=None) -> List[Dict[str, Any]]:
+        """Create several certificate chains for the same subject
+        
+        Subject key generation is independent per certificate, so it is spread
+        over ``executor`` (e.g. a ProcessPoolExecutor) when one is given. Issuing
+        stays in this process because it updates the CA and certificate store.
+        """
+        if executor is not None and count > 1:
+            keypairs = list(executor.map(generate_subject_keypair, [algorithm] * count))
+        else:
+            keypairs = [self.create_keypair(algorithm) for _ in range(count)]
+        
+        return [
+            self._issue_certificate_chain(subject_name, algorithm, keypair, validity_days)
+            for keypair in keypairs
+        ]
+    
+    def _issue_certificate_chain(self, 
+                                subject_name: str, 
+                                algorithm: SignatureAlgorithm,
+                                subject_keypair: SignatureKeyPair,
+                                validity_days: int) -> Dict[str, Any]:
+        """Issue and record a certificate for an existing subject key pair"""
         # Issue certificate
         certificate = self.ca.issue_certificate(
             subject_name=subject_name,
@@ -555,56 +684,17 @@ class HybridSignatureSystem:
         self.logger.info(f"Created certificate chain for {subject_name}")
         return chain
     
-    def benchmark_algorithms(self, message_size: int = 1024, iterations: int = 100) -> Dict[str, Dict[str, float]]:
-        """Benchmark all supported signature algorithms"""
-        results = {}
-        test_message = secrets.token_bytes(message_size)
+    def benchmark_algorithms(self, 
+                            message_size: int = 1024, 
+                            iterations: int = 100) -> Dict[str, Dict[str, float]]:
+        """Benchmark all supported signature algorithms, one after another
         
-        for algorithm in self.supported_algorithms:
-            self.logger.info(f"Benchmarking {algorithm.value}...")
-            
-            try:
-                # Key generation benchmark
-                keygen_times = []
-                sign_times = []
-                verify_times = []
-                
-                for i in range(iterations):
-                    # Key generation
-                    start_time = time.time()
-                    keypair = self.create_keypair(algorithm)
-                    keygen_times.append(time.time() - start_time)
-                    
-                    # Signing
-                    start_time = time.time()
-                    signature_obj = self.sign_message(test_message, keypair.private_key, algorithm)
-                    sign_times.append(time.time() - start_time)
-                    
-                    # Verification
-                    start_time = time.time()
-                    is_valid = self.verify_signature(
-                        test_message, 
-                        signature_obj.signature, 
-                        keypair.public_key, 
-                        algorithm
-                    )
-                    verify_times.append(time.time() - start_time)
-                
-                results[algorithm.value] = {
-                    "keygen_avg_ms": sum(keygen_times) / len(keygen_times) * 1000,
-                    "sign_avg_ms": sum(sign_times) / len(sign_times) * 1000,
-                    "verify_avg_ms": sum(verify_times) / len(verify_times) * 1000,
-                    "public_key_size": keypair.key_size_public,
-                    "private_key_size": keypair.key_size_private,
-                    "signature_size": signature_obj.signature_size,
-                    "verification_success": is_valid
-                }
-                
-            except Exception as e:
-                self.logger.error(f"Benchmark failed for {algorithm.value}: {e}")
-                results[algorithm.value] = {"error": str(e)}
-        
-        return results
+        Algorithms are not run concurrently, since they would share the CPU and
+        skew each other's timings.
+        """
+        test_message = secrets.token_bytes(message_size)
+        return {alg.value: _benchmark_one(alg, test_message, iterations)
+                for alg in self.supported_algorithms}
     
     def crypto_agility_demo(self) -> Dict[str, Any]:
         """Demonstrate crypto-agility by switching between algorithms"""
@@ -0,0 +1,32 @@
+"""
+Tests for the extended post-quantum algorithm registry
+"""
+
+import copy
+import pickle
+import unittest
+
+from extended_pq_algorithms import ExtendedAlgorithmRegistry
+
+class TestAlgorithmParameters(unittest.TestCase):
+    """Test cases for AlgorithmParameters"""
+    
+    def setUp(self):
+        """Set up test fixtures"""
+        self.registry = ExtendedAlgorithmRegistry()
+    
+    def test_pickle_and_copy_round_trip(self):
+        """Test that registry entries survive pickling and copying, including the size slots"""
+        for name, params in self.registry.algorithms.items():
+            for restored in (pickle.loads(pickle.dumps(params)),
+                             copy.copy(params), copy.deepcopy(params)):
+                with self.subTest(algorithm=name):
+                    self.assertEqual(restored, params)
+                    self.assertEqual(
+                        (restored.public_key_size, restored.private_key_size,
+                         restored.signature_size, restored.ciphertext_size),
+                        (params.public_key_size, params.private_key_size,
+                         params.signature_size, params.ciphertext_size))
+
+if __name__ == '__main__':
+    unittest.main()